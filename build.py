@@ -12,6 +12,12 @@ import platform
 import subprocess
 from pathlib import Path
 
+# 依存関係から間接的に取り込まれがちだが実行時には使わないモジュール
+EXCLUDED_MODULES = ["numpy", "pytest", "setuptools", "tkinter"]
+
+# コマンドライン版で除外するGUI関連のモジュール
+CLI_EXCLUDED_MODULES = ["PySide6", "shiboken6", "PySimpleGUI", "PIL"]
+
 def parse_args():
     """コマンドライン引数を解析する"""
     parser = argparse.ArgumentParser(description="ファイル管理自動化ツールのビルドスクリプト")
@@ -24,7 +30,26 @@ def parse_args():
     
     parser.add_argument(
         "--onefile", "-f",
-        help="単一ファイルの実行ファイルを生成",
+        help="単一ファイルの実行ファイルを生成（起動のたびに展開が走るため非推奨）",
+        action="store_true",
+        default=False
+    )
+    
+    parser.add_argument(
+        "--runtime-tmpdir",
+        help="--onefile 時のランタイム展開先ディレクトリ",
+        default=None
+    )
+    
+    parser.add_argument(
+        "--cli-only",
+        help="GUIを含まないコマンドライン版をビルド",
+        action="store_true"
+    )
+    
+    parser.add_argument(
+        "--noupx",
+        help="UPXによる圧縮を無効化（ウイルス対策ソフトの誤検知を避ける場合）",
         action="store_true"
     )
     
@@ -75,12 +100,43 @@ def build_executable(args):
     cmd = [
         "pyinstaller",
         "--noconfirm",
-        "--windowed"
+        "--console" if args.cli_only else "--windowed"
     ]
     
-    # ワンファイルオプション
+    # 実行時に使わないモジュールをバンドルから除外
+    excluded_modules = list(EXCLUDED_MODULES)
+    if args.cli_only:
+        excluded_modules += CLI_EXCLUDED_MODULES
+    for module in excluded_modules:
+        cmd.extend(["--exclude-module", module])
+    
+    # バイトコードの最適化（assertとdocstringを除去）
+    cmd.extend(["--optimize", "2"])
+    
+    # デバッグシンボルの除去（Windowsでは推奨されないため対象外）
+    if system != "Windows":
+        cmd.append("--strip")
+    
+    # UPXによる圧縮（インストールされている場合のみ）
+    upx_path = shutil.which("upx")
+    if args.noupx:
+        cmd.append("--noupx")
+    elif upx_path:
+        cmd.extend(["--upx-dir", os.path.dirname(upx_path)])
+    
+    # 出力形式（デフォルトはフォルダ形式。起動時の展開処理が不要なため高速）
     if args.onefile:
+        print("警告: --onefile は起動のたびにバンドル全体を一時ディレクトリへ展開するため、起動が遅くなります")
         cmd.append("--onefile")
+        
+        # 展開先を固定の場所にしてOSの一時ディレクトリの掃除対象から外す
+        runtime_tmpdir = args.runtime_tmpdir
+        if not runtime_tmpdir and system == "Windows":
+            runtime_tmpdir = os.path.join("%LOCALAPPDATA%", "FileOrganizer", "rt")
+        if runtime_tmpdir:
+            cmd.extend(["--runtime-tmpdir", runtime_tmpdir])
+    else:
+        cmd.append("--onedir")
     
     # 出力ファイル名
     cmd.extend(["--name", args.name])
@@ -146,19 +202,28 @@ VSVersionInfo(
     data_option = f"src{separator}src"
     cmd.extend(["--add-data", data_option])
     
-    # エントリーポイント
-    cmd.append("src/main.py")
+    # エントリーポイント（コマンドライン版はGUIを読み込まないsrc/cli.py）
+    cmd.append("src/cli.py" if args.cli_only else "src/main.py")
     
     # コマンド実行
     print(f"実行コマンド: {' '.join(cmd)}")
-    subprocess.run(cmd, check=True)
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    subprocess.run(cmd, check=True, env=env)
     
     # 後処理
     if system == "Windows" and os.path.exists("file_version_info.txt"):
         os.remove("file_version_info.txt")
     
     # 出力パス
-    output_path = os.path.join("dist", f"{args.name}.exe" if system == "Windows" else args.name)
+    executable_name = f"{args.name}.exe" if system == "Windows" else args.name
+    if args.onefile:
+        output_path = os.path.join("dist", executable_name)
+    else:
+        # フォルダ形式の場合は配布用にディレクトリごとアーカイブする
+        bundle_dir = os.path.join("dist", args.name)
+        archive_base = os.path.join("dist", f"{args.name}-{args.version}-{system}")
+        output_path = shutil.make_archive(archive_base, "zip", "dist", args.name)
+        print(f"実行ファイル: {os.path.join(bundle_dir, executable_name)}")
     
     print(f"ビルド成功: {output_path}")
     return output_path
@@ -168,8 +233,10 @@ def main():
     args = parse_args()
     
     try:
-        import PyInstaller
-            import PySide6
+        try:
+            import PyInstaller
+            if not args.cli_only:
+                import PySide6
         except ImportError:
             print("必要な依存関係が不足しています。以下のコマンドを実行してください:")
             print("pip install pyinstaller PySide6")
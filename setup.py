@@ -1,9 +1,19 @@
+import os
 from setuptools import setup, find_packages
 
+# USE_MYPYC=1 の場合はファイル処理の中核モジュールをmypycでC拡張にコンパイルする
+# （未設定の場合は通常の純粋なPythonパッケージとしてインストールされる）
+ext_modules = []
+if os.environ.get("USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["src/config.py", "src/file_operations.py"])
+
 setup(
     name="file_organizer",
     version="0.1.0",
     packages=find_packages(),
+    package_data={"src": ["assets/*", "assets/themes/*.qss"]},
+    ext_modules=ext_modules,
     install_requires=[
         "PySimpleGUI>=4.60.5",
         "pathlib>=1.0.1",
@@ -14,6 +24,7 @@ setup(
     entry_points={
         "console_scripts": [
             "file_organizer=src.main:main",
+            "file_organizer_cli=src.cli:main",
         ],
     },
     author="Your Name",
@@ -0,0 +1,183 @@
+"""
+ファイル管理自動化ツール - コマンドラインモジュール
+GUI（PySide6）を読み込まない軽量なエントリーポイント
+"""
+
+import sys
+import argparse
+from collections import Counter
+from loguru import logger
+
+from src.config import Config, get_config_path
+from src.file_operations import FileOperations
+from src.utils import setup_logger, get_default_log_dir, is_valid_directory
+
+
+def parse_args(argv=None):
+    """コマンドライン引数を解析（argvを省略した場合はsys.argvを使う）"""
+    parser = argparse.ArgumentParser(description="ファイル管理自動化ツール")
+    
+    parser.add_argument(
+        "--config", "-c",
+        help="設定ファイルのパス",
+        default=get_config_path()
+    )
+    
+    parser.add_argument(
+        "--log-level", "-l",
+        help="ログレベル (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
+        default="INFO"
+    )
+    
+    parser.add_argument(
+        "--source", "-s",
+        help="整理元ディレクトリ",
+        default=None
+    )
+    
+    parser.add_argument(
+        "--no-gui", "-n",
+        help="GUIを使用せずにコマンドラインモードで実行",
+        action="store_true"
+    )
+    
+    parser.add_argument(
+        "--organize", "-o",
+        help="指定したディレクトリのファイルを整理",
+        action="store_true"
+    )
+    
+    parser.add_argument(
+        "--scan", 
+        help="指定したディレクトリのファイルをスキャンのみ",
+        action="store_true"
+    )
+    
+    parser.add_argument(
+        "--parallel-workers", "-w",
+        help="ハッシュ計算・ファイル移動の並列数（省略時は設定ファイルの値、0は自動）",
+        type=int,
+        default=None
+    )
+    
+    return parser.parse_args(argv)
+
+
+def count_extensions(files, extensions):
+    """ファイルをそのまま返しながら、拡張子ごとの件数をextensionsに集計する"""
+    for file in files:
+        extensions[file.extension] += 1
+        yield file
+
+
+def log_extension_stats(extensions):
+    """拡張子の統計をログに出力
+    
+    統計は1件のログにまとめ、件数の辞書をextra（extensions, total）にも付けて
+    構造化ログとして扱えるようにする。
+    """
+    total = sum(extensions.values())
+    
+    # 件数の多い順に1件のメッセージへまとめる
+    lines = [f"{total}個のファイルが見つかりました", "拡張子の統計:"]
+    lines.extend(f"  {ext}: {count}個" for ext, count in extensions.most_common())
+    logger.bind(extensions=dict(extensions), total=total).info("\n".join(lines))
+
+
+def cli_mode(args):
+    """コマンドラインモードでの実行"""
+    # 設定ファイルの読み込み
+    config = Config.load(args.config)
+    
+    # ログの設定
+    log_level = args.log_level if args.log_level else config.log_level
+    log_dir = get_default_log_dir()
+    setup_logger(log_dir, log_level)
+    
+    # 整理設定（スキャンと整理の両方で使う値は先に取り出しておく）
+    organize_config = config.organize_config
+    include_subdirs = organize_config.process_subdirectories
+    max_depth = organize_config.max_depth or None
+    
+    # 整理元ディレクトリ
+    source_dir = args.source if args.source else organize_config.source_dir
+    if not is_valid_directory(source_dir):
+        logger.error(f"有効なディレクトリを指定してください: {source_dir}")
+        return 1
+    
+    # スキャンのみの場合
+    if args.scan and not args.organize:
+        logger.info(f"ディレクトリをスキャン中: {source_dir}")
+        # 拡張子ごとの統計（ファイル一覧は保持せずに逐次集計する）
+        extensions = Counter(
+            file.extension
+            for file in FileOperations.iter_directory_parallel(source_dir, include_subdirs, max_depth)
+        )
+        log_extension_stats(extensions)
+        return 0
+    
+    # ファイル整理の場合
+    if args.organize:
+        logger.info(f"ファイル整理を開始します: {source_dir}")
+        create_date_folders = organize_config.create_date_folders
+        handle_duplicates = organize_config.handle_duplicates
+        duplicate_action = organize_config.duplicate_action
+        max_workers = (
+            args.parallel_workers if args.parallel_workers is not None else organize_config.max_workers
+        )
+        
+        # ファイルのスキャン（一覧を作らずに整理処理へ直接渡す）
+        files = FileOperations.iter_directory_parallel(source_dir, include_subdirs, max_depth)
+        
+        # --scanも指定された場合は、整理と同じ走査の中で拡張子の統計を取る
+        extensions = Counter()
+        if args.scan:
+            files = count_extensions(files, extensions)
+        
+        # ファイルの整理（結果は1件ずつ受け取り、件数とエラーメッセージだけを保持する）
+        counts = {"success": 0, "skipped": 0, "error": 0}
+        errors = []
+        for kind, message in FileOperations.iter_organize_files(
+            files, 
+            config.file_rules, 
+            source_dir, 
+            create_date_folders, 
+            handle_duplicates, 
+            duplicate_action,
+            max_workers=max_workers
+        ):
+            counts[kind] += 1
+            if kind == "error":
+                errors.append(message)
+        
+        if args.scan:
+            log_extension_stats(extensions)
+        
+        # 結果の表示
+        success_count = counts["success"]
+        skipped_count = counts["skipped"]
+        error_count = counts["error"]
+        
+        logger.info(f"{success_count + skipped_count + error_count}個のファイルを処理しました")
+        logger.info(f"成功: {success_count}個")
+        logger.info(f"スキップ: {skipped_count}個")
+        logger.info(f"エラー: {error_count}個")
+        
+        if error_count > 0:
+            # エラーの一覧は1件のログにまとめて出力する
+            logger.warning("\n".join(["エラーが発生したファイル:"] + [f"  {msg}" for msg in errors]))
+        
+        return 0
+    
+    # スキャンもファイル整理も指定されていない場合
+    logger.warning("--scan または --organize のいずれかを指定してください")
+    return 1
+
+
+def main():
+    """コマンドラインモードのメイン関数"""
+    return cli_mode(parse_args())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,17 +3,25 @@
 """
 
 import os
+import sys
+import copy
 import json
 import shutil
+import stat
+import tempfile
+import threading
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+# Python 3.10以降ではslotsを有効にしてインスタンスごとの__dict__を省く
+DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 class ConfigError(Exception):
     """設定関連のエラー"""
     pass
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class FileRule:
     """ファイル振り分けルール"""
     name: str
@@ -22,16 +30,21 @@ class FileRule:
     destination: str = ""
     enabled: bool = True
 
-@dataclass
+# 重複ファイルの処理方法（OrganizeConfig.duplicate_actionに設定できる値）
+DUPLICATE_ACTIONS = ("skip", "rename", "move_to_trash")
+
+@dataclass(**DATACLASS_OPTIONS)
 class OrganizeConfig:
     """整理設定"""
     source_dir: str = ""
     process_subdirectories: bool = False
+    max_depth: int = 0  # たどるサブディレクトリの階層数（0は無制限）
     create_date_folders: bool = False
     handle_duplicates: bool = True
-    duplicate_action: str = "skip"  # "skip", "rename", "move_to_trash"
+    duplicate_action: str = "skip"  # DUPLICATE_ACTIONSのいずれか
+    max_workers: int = 0  # ハッシュ計算・移動の並列数（0は自動）
     
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Config:
     """アプリケーション設定"""
     organize_config: OrganizeConfig = field(default_factory=OrganizeConfig)
@@ -42,11 +55,26 @@ class Config:
     
     @classmethod
     def load(cls, config_path: str) -> 'Config':
-        """設定ファイルから設定を読み込む"""
+        """設定ファイルから設定を読み込む
+        
+        ファイルが前回の読み込みから変更されていなければ再パースせず、キャッシュの
+        コピーを返す（呼び出し側で変更してもキャッシュには影響しない）。
+        """
         config_file = Path(config_path)
         
+        # ファイルが前回の読み込みから変更されていなければ再パースしない
+        cache_key = str(config_file)
+        try:
+            stat = config_file.stat()
+        except OSError:
+            stat = None
+        if stat is not None:
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return copy.deepcopy(cached[2])
+        
         # 設定ファイルが存在しない場合はデフォルト設定を作成して保存
-        if not config_file.exists():
+        if stat is None:
             config = cls()
             # デフォルトのファイルルールを追加
             config.file_rules = [
@@ -80,8 +108,8 @@ class Config:
             return config
         
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_dict = json.load(f)
+            # ファイル全体を一度に読み込んでからパースする
+            config_dict = json.loads(config_file.read_bytes())
             
             # 設定を構築
             config = cls()
@@ -113,28 +141,50 @@ class Config:
                     file_rules.append(rule)
                 config.file_rules = file_rules
             
-            return config
+            _CONFIG_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, config)
+            return copy.deepcopy(config)
             
         except Exception as e:
             raise ConfigError(f"設定ファイルの読み込みに失敗しました: {e}")
     
-    def save(self, config_path: str) -> None:
-        """設定をファイルに保存"""
+    def to_json(self) -> str:
+        """設定をJSON文字列に変換"""
+        return json.dumps(asdict(self), ensure_ascii=False, indent=2)
+    
+    def save(self, config_path: str, text: Optional[str] = None) -> None:
+        """設定をファイルに保存
+        
+        textを指定した場合は、to_json()で事前に作成した内容をそのまま書き込む。
+        書き込みはロックで直列化されるため、別スレッドから呼び出してもよい。
+        """
         config_file = Path(config_path)
         
         # 親ディレクトリが存在しない場合は作成
         config_file.parent.mkdir(parents=True, exist_ok=True)
         
-        try:
-            # 設定を辞書に変換
-            config_dict = asdict(self)
-            
-            # 設定をファイルに保存
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, ensure_ascii=False, indent=2)
+        with _SAVE_LOCK:
+            try:
+                if text is None:
+                    text = self.to_json()
                 
-        except Exception as e:
-            raise ConfigError(f"設定ファイルの保存に失敗しました: {e}")
+                # 同じディレクトリの一時ファイルに書き込んでから置き換える
+                # （書き込み途中で中断しても既存の設定ファイルは壊れない）
+                fd, temp_path = tempfile.mkstemp(prefix=f"{config_file.name}.", suffix=".tmp", dir=config_file.parent)
+                try:
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        f.write(text)
+                    # mkstempは0600で作成するため、既存ファイルの権限（新規の場合はumaskに従った権限）に合わせる
+                    os.chmod(temp_path, _file_mode(config_file))
+                    os.replace(temp_path, config_file)
+                except BaseException:
+                    os.unlink(temp_path)
+                    raise
+                    
+            except Exception as e:
+                raise ConfigError(f"設定ファイルの保存に失敗しました: {e}")
+            finally:
+                # 次回の読み込みでは保存した内容をパースし直す
+                _CONFIG_CACHE.pop(str(config_file), None)
     
     def backup(self, config_path: str) -> str:
         """設定ファイルのバックアップを作成"""
@@ -142,20 +192,35 @@ class Config:
         if not source.exists():
             raise ConfigError("バックアップ対象の設定ファイルが存在しません")
         
-        # バックアップファイル名を生成
-        backup_path = f"{config_path}.backup"
-        i = 1
-        while Path(backup_path).exists():
-            backup_path = f"{config_path}.backup{i}"
-            i += 1
-        
-        # バックアップを作成
+        # バックアップファイルを一意な名前で作成（存在確認の繰り返しや名前の競合がない）
         try:
+            fd, backup_path = tempfile.mkstemp(prefix=f"{source.name}.backup.", dir=source.parent)
+            os.close(fd)
             shutil.copy2(source, backup_path)
             return backup_path
         except Exception as e:
             raise ConfigError(f"設定ファイルのバックアップに失敗しました: {e}")
 
+# 読み込み済み設定のキャッシュ（パス -> (更新時刻[ns], サイズ, 設定)）
+# 呼び出し側にはコピーを返すため、キャッシュ内の設定は変更されない
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Config]] = {}
+
+# 設定ファイルの書き込みを直列化するロック
+_SAVE_LOCK = threading.Lock()
+
+# 新規ファイルの権限（通常のopenと同じく0o666からumaskを除く）
+# umaskは取得と同時に設定し直す必要があるため、保存スレッドではなくインポート時に一度だけ取得する
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
+def _file_mode(path: Path) -> int:
+    """保存するファイルに設定する権限を取得（既存ファイルがあればその権限を引き継ぐ）"""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        return _NEW_FILE_MODE
+
 def get_config_path() -> str:
     """設定ファイルのパスを取得"""
     # Windowsの場合
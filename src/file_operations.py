@@ -2,24 +2,42 @@
 ファイル操作モジュール - ファイルの検索、移動、整理などの機能を提供
 """
 
+from __future__ import annotations
+
 import os
 import re
+import sys
+import errno
+import mmap
 import shutil
 import hashlib
 import datetime
+import unicodedata
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Set, Tuple, Optional, Any
+from typing import List, Dict, DefaultDict, Set, Tuple, Optional, Any, Callable, Pattern, Iterable, Iterator
 from dataclasses import dataclass
-import send2trash
 from loguru import logger
 
-from src.config import FileRule
+from src.config import FileRule, DATACLASS_OPTIONS
+
+# 重複候補の絞り込みに使う先頭部分のサイズ
+QUICK_HASH_BYTES = 4096
+
+# 重複判定に使うハッシュ値のバイト数（内容の識別には16バイトで十分）
+HASH_DIGEST_SIZE = 16
 
-@dataclass
+# ファイル名の大文字小文字（とUnicode正規化の違い）を区別しないプラットフォーム
+CASE_INSENSITIVE_NAMES = os.name == 'nt' or sys.platform == 'darwin'
+
+@dataclass(**DATACLASS_OPTIONS)
 class FileInfo:
     """ファイル情報を格納するクラス"""
     path: Path
     name: str
+    stem: str
     extension: str
     size: int
     created_time: datetime.datetime
@@ -33,12 +51,27 @@ class FileInfo:
         return cls(
             path=file_path,
             name=file_path.name,
+            stem=file_path.stem,
             extension=file_path.suffix.lower(),
             size=stat.st_size,
             created_time=datetime.datetime.fromtimestamp(stat.st_ctime),
             modified_time=datetime.datetime.fromtimestamp(stat.st_mtime)
         )
     
+    @classmethod
+    def from_dirent(cls, entry: os.DirEntry, stat: os.stat_result) -> 'FileInfo':
+        """os.scandirのエントリとstat結果からFileInfoオブジェクトを生成"""
+        stem, extension = os.path.splitext(entry.name)
+        return cls(
+            path=Path(entry.path),
+            name=entry.name,
+            stem=stem,
+            extension=extension.lower(),
+            size=stat.st_size,
+            created_time=datetime.datetime.fromtimestamp(stat.st_ctime),
+            modified_time=datetime.datetime.fromtimestamp(stat.st_mtime)
+        )
+    
     def calculate_hash(self) -> str:
         """ファイルのハッシュ値を計算"""
         if self.hash:
@@ -47,172 +80,537 @@ class FileInfo:
         # 大きなファイルの場合は最初の1MBだけを使用
         max_bytes = 1024 * 1024  # 1MB
         
-        hasher = hashlib.md5()
+        # BLAKE2bは標準ライブラリで利用でき、MD5やSHA-256よりも高速
+        hasher = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
         with open(self.path, 'rb') as f:
-            buf = f.read(max_bytes)
-            hasher.update(buf)
+            size = min(max_bytes, os.fstat(f.fileno()).st_size)
+            if size > 0:
+                try:
+                    # ページキャッシュを直接ハッシュ関数に渡し、中間のbytesを作らない
+                    with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                        hasher.update(mm)
+                except (OSError, ValueError):
+                    # mmapできないファイルは通常の読み込みで処理
+                    f.seek(0)
+                    hasher.update(f.read(max_bytes))
         
         self.hash = hasher.hexdigest()
         return self.hash
+    
+    def quick_hash(self) -> str:
+        """ファイル先頭の小さな範囲だけのハッシュ値を計算（重複候補の絞り込み用）"""
+        with open(self.path, 'rb') as f:
+            return hashlib.blake2b(f.read(QUICK_HASH_BYTES), digest_size=HASH_DIGEST_SIZE).hexdigest()
+
+
+def _iter_files(source_dir: str, recurse: bool,
+                max_depth: Optional[int] = None) -> Iterator[Tuple[os.DirEntry, os.stat_result]]:
+    """os.scandirでディレクトリを走査し、ファイルのエントリとstat結果を返す
+    
+    max_depthを指定すると、たどるサブディレクトリの階層をその数までに制限する。
+    """
+    # 再帰呼び出しではなく明示的なスタックで走査する（ディレクトリ, 階層）
+    stack: List[Tuple[str, int]] = [(source_dir, 0)]
+    while stack:
+        current_dir, depth = stack.pop()
+        descend = recurse and (max_depth is None or depth < max_depth)
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if descend:
+                                stack.append((entry.path, depth + 1))
+                        elif entry.is_file():
+                            # DirEntryのキャッシュを利用してstatの重複を避ける
+                            yield entry, entry.stat()
+                    except OSError as e:
+                        logger.warning(f"ファイル情報の取得に失敗しました: {entry.path} ({e})")
+        except OSError as e:
+            if current_dir == source_dir:
+                raise
+            logger.warning(f"ディレクトリを読み込めません: {current_dir} ({e})")
+
+
+# ハッシュ計算・ファイル移動に使うスレッド数の既定値（I/O待ちが主なのでCPU数より多めにする）
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def _split_directory(directory: str) -> Tuple[List['FileInfo'], List[str]]:
+    """ディレクトリ直下を1回走査し、ファイルとサブディレクトリのパスに振り分ける
+    
+    ファイルの情報はDirEntryのキャッシュから作成する。ディレクトリ自体を
+    読み込めない場合はOSErrorを送出する。
+    """
+    files: List[FileInfo] = []
+    subdirs: List[str] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    files.append(FileInfo.from_dirent(entry, entry.stat()))
+            except OSError as e:
+                logger.warning(f"ファイル情報の取得に失敗しました: {entry.path} ({e})")
+    return files, subdirs
+
+
+def _scan_subtree(directory: str, recurse: bool, max_depth: Optional[int]) -> List['FileInfo']:
+    """サブディレクトリ以下のファイル一覧を取得（読み込めない場合は警告して空にする）"""
+    try:
+        return [FileInfo.from_dirent(entry, stat) for entry, stat in _iter_files(directory, recurse, max_depth)]
+    except OSError as e:
+        logger.warning(f"ディレクトリを読み込めません: {directory} ({e})")
+        return []
+
+
+# サブディレクトリを並列にスキャンするスレッド数
+PARALLEL_SCAN_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+# 並列スキャンに切り替える直下のサブディレクトリ数（これ以下なら逐次にスキャンする）
+PARALLEL_SCAN_MIN_SUBDIRS = 4
+
+
+def _prefetch_hash(file_info: 'FileInfo') -> None:
+    """ハッシュ値を事前計算（エラーは移動計画の作成時に改めて報告される）"""
+    try:
+        file_info.calculate_hash()
+    except OSError:
+        pass
+
+
+def _name_key(name: str) -> str:
+    """ファイル名の衝突判定用キー（Windows/macOSでは大文字小文字・Unicode正規化の違いを同一視）"""
+    if not CASE_INSENSITIVE_NAMES:
+        return name
+    return unicodedata.normalize('NFC', name).casefold()
+
+
+def _existing_names(directory: str) -> Set[str]:
+    """ディレクトリ内の既存エントリ名の衝突判定用キーを取得"""
+    try:
+        return {_name_key(name) for name in os.listdir(directory)}
+    except FileNotFoundError:
+        return set()
+
+
+def _fast_move(src: str, dst: str) -> None:
+    """ファイルを移動（同一ファイルシステム内ではrename一回で済ませる）"""
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    
+    # 別ファイルシステムへの移動はコピー＋削除
+    shutil.move(src, dst)
+
+
+def _execute_move(file_info: 'FileInfo', dest_path: Optional[str]) -> None:
+    """計画に従ってファイルを移動（移動先がNoneの場合はゴミ箱へ移動）"""
+    if dest_path is None:
+        # ゴミ箱への移動は重複ファイル処理でしか使わないため必要になってから読み込む
+        import send2trash  # type: ignore
+        send2trash.send2trash(str(file_info.path))
+    else:
+        _fast_move(str(file_info.path), dest_path)
+
+
+# インラインフラグを持たないパターンをIGNORECASEでコンパイルしたときのフラグ
+_BASE_PATTERN_FLAGS = re.compile("", re.IGNORECASE).flags
+
+# 全体に効くインラインフラグ（"(?i)"など）。まとめると先頭以外に置かれてしまう
+_GLOBAL_FLAGS_PATTERN = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+class _CompiledRules:
+    """照合用に前処理したルール
+    
+    拡張子は「拡張子 -> (ルールの順位, ルール)」の辞書で引き、パターンを持つ
+    ルールだけを順に調べる。順位を比較することで、元のルールの並び順による
+    優先順位は保たれる。
+    """
+    
+    def __init__(self, rules: List[FileRule]):
+        self.extension_index: Dict[str, Tuple[int, FileRule]] = {}
+        self.pattern_rules: List[Tuple[int, FileRule, List[Pattern]]] = []
+        
+        for order, rule in enumerate(rules):
+            if not rule.enabled:
+                continue
+            
+            for extension in rule.extensions:
+                # 先に定義されたルールを優先
+                self.extension_index.setdefault(extension.lower(), (order, rule))
+            
+            compiled = []
+            for pattern in rule.patterns:
+                try:
+                    compiled.append(re.compile(pattern, re.IGNORECASE))
+                except re.error:
+                    # 正規表現エラーはコンパイル時に除外する
+                    continue
+            if compiled:
+                self.pattern_rules.append((order, rule, self._combine(compiled)))
+    
+    @staticmethod
+    def _combine(patterns: List[Pattern]) -> List[Pattern]:
+        """ルールのパターンを1つの正規表現にまとめ、1回の検索で判定できるようにする
+        
+        グループを持つパターン（まとめると後方参照の番号がずれる）や、全体に効く
+        インラインフラグを持つパターンがある場合はまとめずに個別に照合する。
+        """
+        if len(patterns) == 1:
+            return patterns
+        if any(
+            pattern.groups
+            or pattern.flags != _BASE_PATTERN_FLAGS
+            or _GLOBAL_FLAGS_PATTERN.search(pattern.pattern)
+            for pattern in patterns
+        ):
+            return patterns
+        try:
+            return [re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns), re.IGNORECASE)]
+        except re.error:
+            return patterns
+    
+    def match(self, file_info: 'FileInfo') -> Optional[FileRule]:
+        """ファイルに一致するルールを検索"""
+        hit = self.extension_index.get(file_info.extension)
+        
+        # 拡張子で一致したルールより前にあるパターンルールだけを調べる
+        limit = hit[0] if hit else sys.maxsize
+        name = file_info.name
+        for order, rule, patterns in self.pattern_rules:
+            if order >= limit:
+                break
+            for pattern in patterns:
+                if pattern.search(name):
+                    return rule
+        
+        return hit[1] if hit else None
+
+
+# 前処理済みルールのキャッシュ（ルールの識別子と内容 -> 前処理済みルール）
+# キャッシュがルールへの参照を保持するため、キーに含むidが別のルールに再利用されることはない
+_COMPILED_RULES_CACHE: Dict[Tuple[Any, ...], _CompiledRules] = {}
+_COMPILED_RULES_CACHE_SIZE = 8
+
+
+def _compile_rules(rules: List[FileRule]) -> _CompiledRules:
+    """ルールを前処理する（同じ内容のルールに対しては前回の結果を再利用する）"""
+    key = tuple(
+        (id(rule), rule.enabled, tuple(rule.extensions), tuple(rule.patterns))
+        for rule in rules
+    )
+    compiled = _COMPILED_RULES_CACHE.get(key)
+    if compiled is None:
+        if len(_COMPILED_RULES_CACHE) >= _COMPILED_RULES_CACHE_SIZE:
+            _COMPILED_RULES_CACHE.clear()
+        compiled = _COMPILED_RULES_CACHE[key] = _CompiledRules(rules)
+    return compiled
 
 
 class FileOperations:
     """ファイル操作クラス"""
     
     @staticmethod
-    def scan_directory(source_dir: str, include_subdirs: bool = False) -> List[FileInfo]:
-        """ディレクトリ内のファイルをスキャン"""
+    def iter_directory(source_dir: str, include_subdirs: bool = False,
+                       max_depth: Optional[int] = None) -> Iterator[FileInfo]:
+        """ディレクトリ内のファイルを1つずつ返す（一覧全体をメモリに保持しない）
+        
+        include_subdirsの場合、max_depthでたどるサブディレクトリの階層数を
+        制限できる（Noneは無制限）。
+        """
         if not source_dir or not os.path.isdir(source_dir):
             logger.error(f"無効なディレクトリ: {source_dir}")
-            return []
-        
-        files = []
-        source_path = Path(source_dir)
+            return
         
         try:
-            # 再帰的またはトップレベルのみのスキャン
-            if include_subdirs:
-                # 再帰的にすべてのファイルをスキャン
-                for file_path in source_path.glob('**/*'):
-                    if file_path.is_file():
-                        files.append(FileInfo.from_path(file_path))
-            else:
-                # 直下のファイルのみスキャン
-                for file_path in source_path.glob('*'):
-                    if file_path.is_file():
-                        files.append(FileInfo.from_path(file_path))
-            
-            logger.info(f"{len(files)}個のファイルをスキャンしました")
-            return files
-            
+            # 再帰的またはトップレベルのみのスキャン（1エントリにつきstatは1回）
+            for entry, stat in _iter_files(source_dir, include_subdirs, max_depth):
+                yield FileInfo.from_dirent(entry, stat)
         except Exception as e:
             logger.error(f"ディレクトリのスキャン中にエラーが発生しました: {e}")
-            return []
+    
+    @staticmethod
+    def iter_directory_parallel(source_dir: str, include_subdirs: bool = False,
+                                max_depth: Optional[int] = None) -> Iterator[FileInfo]:
+        """直下のサブディレクトリごとにスレッドプールで並列にスキャンする
+        
+        メタデータの読み込み待ちが主な大きなツリー向け。直下のサブディレクトリが
+        PARALLEL_SCAN_MIN_SUBDIRS個以下の場合は、スレッドを使わず逐次にスキャンする。
+        結果はスキャン元直下のファイル、サブディレクトリ（一覧の順）の順に返す。
+        """
+        if not include_subdirs or not source_dir:
+            yield from FileOperations.iter_directory(source_dir, include_subdirs, max_depth)
+            return
+        
+        # 直下は1回の走査でファイルとサブディレクトリに振り分ける（isdirやstatを別に呼ばない）
+        try:
+            top_files, subdirs = _split_directory(source_dir)
+        except OSError as e:
+            logger.error(f"無効なディレクトリ: {source_dir} ({e})")
+            return
+        
+        # 階層数が0以下ならサブディレクトリはたどらない（iter_directoryと同じ）
+        if max_depth is not None and max_depth <= 0:
+            subdirs = []
+        
+        # サブディレクトリ自体が1階層目なので、その中でたどれる階層は1つ少ない
+        remaining = None if max_depth is None else max_depth - 1
+        scan_subtree = partial(_scan_subtree, recurse=remaining != 0, max_depth=remaining)
+        
+        yield from top_files
+        if len(subdirs) <= PARALLEL_SCAN_MIN_SUBDIRS:
+            for subdir in subdirs:
+                yield from scan_subtree(subdir)
+            return
+        
+        with ThreadPoolExecutor(max_workers=PARALLEL_SCAN_WORKERS) as executor:
+            for files in executor.map(scan_subtree, subdirs):
+                yield from files
+    
+    @staticmethod
+    def list_subdirectories(directory: str) -> List[str]:
+        """直下のサブディレクトリのパスを取得（シンボリックリンクはたどらない）"""
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                    except OSError as e:
+                        logger.warning(f"ファイル情報の取得に失敗しました: {entry.path} ({e})")
+        except OSError as e:
+            logger.error(f"ディレクトリを読み込めません: {directory} ({e})")
+        return subdirs
+    
+    @staticmethod
+    def scan_directory(source_dir: str, include_subdirs: bool = False,
+                       max_depth: Optional[int] = None) -> List[FileInfo]:
+        """ディレクトリ内のファイルをスキャン"""
+        files = list(FileOperations.iter_directory(source_dir, include_subdirs, max_depth))
+        logger.info(f"{len(files)}個のファイルをスキャンしました")
+        return files
     
     @staticmethod
     def match_file_with_rules(file_info: FileInfo, rules: List[FileRule]) -> Optional[FileRule]:
         """ファイルに一致するルールを検索"""
-        for rule in rules:
-            if not rule.enabled:
-                continue
-                
-            # 拡張子マッチング
-            if rule.extensions and file_info.extension in rule.extensions:
-                return rule
-            
-            # パターンマッチング
-            if rule.patterns:
-                for pattern in rule.patterns:
-                    try:
-                        if re.search(pattern, file_info.name, re.IGNORECASE):
-                            return rule
-                    except re.error:
-                        # 正規表現エラーは無視して次のパターンへ
-                        continue
-        
-        return None
+        return _compile_rules(rules).match(file_info)
     
     @staticmethod
-    def organize_files(files: List[FileInfo], rules: List[FileRule], 
+    def organize_files(files: Iterable[FileInfo], rules: List[FileRule], 
                        base_dir: str, create_date_folders: bool = False,
                        handle_duplicates: bool = True, 
-                       duplicate_action: str = "skip") -> Dict[str, List[str]]:
-        """ファイルをルールに従って整理"""
-        result = {
+                       duplicate_action: str = "skip",
+                       max_workers: Optional[int] = None,
+                       progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, List[str]]:
+        """ファイルをルールに従って整理
+        
+        結果を"success"/"skipped"/"error"ごとのメッセージ一覧にまとめて返す。
+        件数やメッセージを逐次に処理する場合はiter_organize_filesを使う。
+        """
+        result: Dict[str, List[str]] = {
             "success": [],
             "skipped": [],
             "error": []
         }
+        for kind, message in FileOperations.iter_organize_files(
+            files, rules, base_dir, create_date_folders, handle_duplicates,
+            duplicate_action, max_workers, progress_callback
+        ):
+            result[kind].append(message)
+        return result
+    
+    @staticmethod
+    def iter_organize_files(files: Iterable[FileInfo], rules: List[FileRule], 
+                            base_dir: str, create_date_folders: bool = False,
+                            handle_duplicates: bool = True, 
+                            duplicate_action: str = "skip",
+                            max_workers: Optional[int] = None,
+                            progress_callback: Optional[Callable[[int, int], None]] = None
+                            ) -> Iterator[Tuple[str, str]]:
+        """ファイルをルールに従って整理し、結果を1件ずつ返すジェネレーター
         
-        # 重複ファイルの検出用マップ（ハッシュ値 -> ファイルパス）
-        hash_map = {}
+        ファイルごとに(種別, メッセージ)を返す。種別は"success"/"skipped"/"error"のいずれか。
+        結果の一覧を保持しないため、大量のファイルでもメモリ使用量が増えない。
         
+        移動先の決定は逐次に行い、ハッシュ計算とファイルの移動は
+        スレッドプールで並列に実行する。max_workersが未指定または0以下の場合は
+        DEFAULT_MAX_WORKERSのスレッド数を使う。progress_callbackを指定すると、
+        移動が1件終わるごとに(完了数, 総数)で呼び出す。途中で反復をやめた場合は
+        未着手の移動を取り消す。
+        """
+        # ルールの前処理はバッチ全体で一度だけ行う
+        compiled_rules = _compile_rules(rules)
+        
+        # ルールに一致するファイルの抽出
+        matched: List[Tuple[FileInfo, FileRule]] = []
         for file_info in files:
-            try:
-                # ルールに一致するかチェック
-                rule = FileOperations.match_file_with_rules(file_info, rules)
-                if not rule:
-                    logger.debug(f"ルールに一致しないファイル: {file_info.name}")
-                    result["skipped"].append(f"{file_info.name} - マッチするルールがありません")
-                    continue
-                
-                # 宛先ディレクトリを作成
-                dest_dir = Path(base_dir) / rule.destination
-                
-                # 日付フォルダを使用する場合
-                if create_date_folders:
-                    date_str = file_info.modified_time.strftime('%Y-%m-%d')
-                    dest_dir = dest_dir / date_str
-                
-                # 宛先ディレクトリが存在しない場合は作成
-                dest_dir.mkdir(parents=True, exist_ok=True)
-                
-                # 宛先ファイルパス
-                dest_path = dest_dir / file_info.name
-                
-                # 重複ファイルのチェック
-                if handle_duplicates:
-                    # ハッシュ値を計算
-                    file_hash = file_info.calculate_hash()
+            rule = compiled_rules.match(file_info)
+            if not rule:
+                logger.debug(f"ルールに一致しないファイル: {file_info.name}")
+                yield "skipped", f"{file_info.name} - マッチするルールがありません"
+                continue
+            matched.append((file_info, rule))
+        
+        if not matched:
+            return
+        
+        # 未指定または0以下の場合は既定のスレッド数を使う
+        if not max_workers or max_workers <= 0:
+            max_workers = DEFAULT_MAX_WORKERS
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # ハッシュ値を並列に事前計算（失敗したファイルは計画時にエラーとして扱う）
+            if handle_duplicates:
+                list(executor.map(_prefetch_hash, [file_info for file_info, _ in matched]))
+            
+            # 移動計画の作成（重複判定と名前の衝突回避は順序に依存するため逐次に行う）
+            plan: List[Tuple[FileInfo, Optional[str]]] = []
+            # 重複ファイルの検出用マップ（ハッシュ値 -> ファイルパス）
+            hash_map: Dict[str, str] = {}
+            # 移動先ディレクトリごとの使用済みファイル名（既存ファイルとこのバッチでの予約分）
+            taken_names: Dict[str, Set[str]] = {}
+            # ルールごとの宛先ディレクトリ（Pathを使わず文字列で結合する）
+            dest_roots: Dict[int, str] = {}
+            
+            for file_info, rule in matched:
+                try:
+                    # 宛先ディレクトリ（ルールごとの結合結果を再利用する）
+                    dest_dir = dest_roots.get(id(rule))
+                    if dest_dir is None:
+                        dest_dir = dest_roots[id(rule)] = os.path.join(base_dir, rule.destination)
+                    
+                    # 日付フォルダを使用する場合
+                    if create_date_folders:
+                        date_str = file_info.modified_time.strftime('%Y-%m-%d')
+                        dest_dir = os.path.join(dest_dir, date_str)
                     
-                    # すでに同じハッシュのファイルが処理されている場合
-                    if file_hash in hash_map:
-                        prev_file = hash_map[file_hash]
+                    # 宛先ファイル名
+                    dest_name = file_info.name
+                    
+                    # 重複ファイルのチェック
+                    if handle_duplicates:
+                        # ハッシュ値を計算（事前計算済みの場合はキャッシュを使用）
+                        file_hash = file_info.calculate_hash()
+                        
+                        # すでに同じハッシュのファイルが処理されている場合
+                        if file_hash in hash_map:
+                            prev_file = hash_map[file_hash]
+                            
+                            if duplicate_action == "skip":
+                                yield "skipped", f"{file_info.name} - 重複ファイル（{prev_file}と同一）"
+                                continue
+                            elif duplicate_action == "rename":
+                                # ファイル名にサフィックスを追加
+                                suffix = file_info.name[len(file_info.stem):]
+                                dest_name = f"{file_info.stem}_duplicate{suffix}"
+                            elif duplicate_action == "move_to_trash":
+                                # ファイルをゴミ箱に移動
+                                plan.append((file_info, None))
+                                continue
                         
-                        if duplicate_action == "skip":
-                            result["skipped"].append(f"{file_info.name} - 重複ファイル（{prev_file}と同一）")
-                            continue
-                        elif duplicate_action == "rename":
-                            # ファイル名にサフィックスを追加
-                            name_parts = os.path.splitext(file_info.name)
-                            new_name = f"{name_parts[0]}_duplicate{name_parts[1]}"
-                            dest_path = dest_dir / new_name
-                        elif duplicate_action == "move_to_trash":
-                            # ファイルをゴミ箱に移動
-                            send2trash.send2trash(str(file_info.path))
-                            result["success"].append(f"{file_info.name} - 重複ファイルのためゴミ箱に移動")
-                            continue
+                        # ハッシュマップに追加
+                        hash_map[file_hash] = os.path.join(dest_dir, dest_name)
                     
-                    # ハッシュマップに追加
-                    hash_map[file_hash] = str(dest_path)
-                
-                # 移動先にすでに同名ファイルが存在する場合
-                if dest_path.exists():
-                    # ファイル名を変更（名前_数字.拡張子）
-                    counter = 1
-                    while True:
-                        name_parts = os.path.splitext(file_info.name)
-                        new_name = f"{name_parts[0]}_{counter}{name_parts[1]}"
-                        new_dest_path = dest_dir / new_name
-                        if not new_dest_path.exists():
-                            dest_path = new_dest_path
-                            break
-                        counter += 1
-                
-                # ファイルを移動
-                shutil.move(str(file_info.path), str(dest_path))
-                result["success"].append(f"{file_info.name} -> {dest_path}")
-                
-            except Exception as e:
-                logger.error(f"ファイル {file_info.name} の処理中にエラーが発生しました: {e}")
-                result["error"].append(f"{file_info.name} - エラー: {str(e)}")
-        
-        return result
+                    # 宛先ディレクトリの作成と一覧の取得はディレクトリごとに一度だけ行う
+                    names = taken_names.get(dest_dir)
+                    if names is None:
+                        os.makedirs(dest_dir, exist_ok=True)
+                        names = taken_names[dest_dir] = _existing_names(dest_dir)
+                    
+                    # 移動先にすでに同名ファイルが存在する場合（このバッチでの予約分も含む）
+                    if _name_key(dest_name) in names:
+                        # ファイル名を変更（名前_数字.拡張子）
+                        suffix = file_info.name[len(file_info.stem):]
+                        counter = 1
+                        while True:
+                            new_name = f"{file_info.stem}_{counter}{suffix}"
+                            if _name_key(new_name) not in names:
+                                dest_name = new_name
+                                break
+                            counter += 1
+                    
+                    names.add(_name_key(dest_name))
+                    plan.append((file_info, os.path.join(dest_dir, dest_name)))
+                    
+                except Exception as e:
+                    logger.error(f"ファイル {file_info.name} の処理中にエラーが発生しました: {e}")
+                    yield "error", f"{file_info.name} - エラー: {str(e)}"
+            
+            # 計画に従って並列に移動
+            futures = [
+                executor.submit(_execute_move, file_info, dest_path)
+                for file_info, dest_path in plan
+            ]
+            
+            total = len(plan)
+            try:
+                for done, ((file_info, dest_path), future) in enumerate(zip(plan, futures), 1):
+                    try:
+                        future.result()
+                        if dest_path is None:
+                            message = f"{file_info.name} - 重複ファイルのためゴミ箱に移動"
+                        else:
+                            message = f"{file_info.name} -> {dest_path}"
+                    except Exception as e:
+                        logger.error(f"ファイル {file_info.name} の処理中にエラーが発生しました: {e}")
+                        kind, message = "error", f"{file_info.name} - エラー: {str(e)}"
+                    else:
+                        kind = "success"
+                    
+                    if progress_callback is not None:
+                        progress_callback(done, total)
+                    yield kind, message
+            finally:
+                # 反復が途中で打ち切られた場合は、まだ始まっていない移動を取り消す
+                for future in futures:
+                    future.cancel()
     
     @staticmethod
-    def find_duplicates(files: List[FileInfo]) -> Dict[str, List[FileInfo]]:
-        """重複ファイルを検出"""
-        # ハッシュ値ごとにファイルをグループ化
-        hash_groups = {}
+    def find_duplicates(files: Iterable[FileInfo]) -> Dict[Tuple[int, str], List[FileInfo]]:
+        """重複ファイルを検出し、(サイズ, ハッシュ値)ごとのグループを返す
         
+        サイズが一致するファイル同士、さらに先頭部分のハッシュ値が一致する
+        ファイル同士だけを比較し、読み込むデータ量を抑える。ハッシュ値の計算は
+        スレッドプールで並列に行う。filesはジェネレーターでもよく、一度だけ走査する。
+        """
+        # サイズが異なるファイルは重複し得ないので、まずサイズでグループ化
+        by_size: DefaultDict[int, List[FileInfo]] = defaultdict(list)
         for file_info in files:
-            file_hash = file_info.calculate_hash()
-            if file_hash not in hash_groups:
-                hash_groups[file_hash] = []
-            hash_groups[file_hash].append(file_info)
+            by_size[file_info.size].append(file_info)
+        size_groups = {size: group for size, group in by_size.items() if len(group) > 1}
+        
+        # サイズとハッシュ値の組ごとにファイルをグループ化
+        # （ハッシュ値は先頭1MBだけから計算するため、サイズの異なるファイルを同一視しない）
+        hash_groups: DefaultDict[Tuple[int, str], List[FileInfo]] = defaultdict(list)
+        
+        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+            head_groups: List[List[FileInfo]] = []
+            large_files: List[FileInfo] = []
+            for size, candidates in size_groups.items():
+                # 小さなファイルは先頭部分のハッシュで全体が分かるため絞り込みを省略
+                if size <= QUICK_HASH_BYTES:
+                    head_groups.append(candidates)
+                else:
+                    large_files.extend(candidates)
+            
+            # 大きなファイルは先頭部分のハッシュ（並列に計算）で候補を絞り込む
+            by_head: DefaultDict[Tuple[int, str], List[FileInfo]] = defaultdict(list)
+            for file_info, head in zip(large_files, executor.map(FileInfo.quick_hash, large_files)):
+                by_head[(file_info.size, head)].append(file_info)
+            head_groups.extend(group for group in by_head.values() if len(group) > 1)
+            
+            # 残った候補のハッシュ値を並列に計算してグループ化
+            targets = [file_info for group in head_groups for file_info in group]
+            for file_info, file_hash in zip(targets, executor.map(FileInfo.calculate_hash, targets)):
+                hash_groups[(file_info.size, file_hash)].append(file_info)
         
         # 2つ以上のファイルがある（重複している）グループのみを返す
-        duplicates = {h: files for h, files in hash_groups.items() if len(files) > 1}
+        duplicates = {key: files for key, files in hash_groups.items() if len(files) > 1}
         return duplicates
     
     @staticmethod
@@ -228,23 +626,29 @@ class FileOperations:
     @staticmethod
     def get_file_extensions(directory: str, include_subdirs: bool = False) -> Dict[str, int]:
         """ディレクトリ内のファイル拡張子とその数を取得"""
-        extensions = {}
-        source_path = Path(directory)
+        extensions: Counter[str] = Counter()
         
-        try:
-            # 再帰的またはトップレベルのみのスキャン
-            pattern = '**/*' if include_subdirs else '*'
-            
-            for file_path in source_path.glob(pattern):
-                if file_path.is_file():
-                    ext = file_path.suffix.lower()
-                    if ext in extensions:
-                        extensions[ext] += 1
-                    else:
-                        extensions[ext] = 1
-            
-            return extensions
-            
-        except Exception as e:
-            logger.error(f"拡張子の検索中にエラーが発生しました: {e}")
-            return {}
\ No newline at end of file
+        # DirEntryの種別情報を使い、ファイルごとのstatを行わずに集計する
+        stack = [directory]
+        while stack:
+            current_dir = stack.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if include_subdirs:
+                                    stack.append(entry.path)
+                            elif entry.is_file():
+                                extensions[os.path.splitext(entry.name)[1].lower()] += 1
+                        except OSError as e:
+                            logger.warning(f"ファイル情報の取得に失敗しました: {entry.path} ({e})")
+            except OSError as e:
+                # 読み込めないディレクトリは飛ばして集計を続ける
+                if current_dir == directory:
+                    logger.error(f"拡張子の検索中にエラーが発生しました: {e}")
+                else:
+                    logger.warning(f"ディレクトリを読み込めません: {current_dir} ({e})")
+                continue
+        
+        return dict(extensions)
\ No newline at end of file
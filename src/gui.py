@@ -3,23 +3,34 @@ GUIモジュール - PySide6によるユーザーインターフェースを提
 """
 
 import os
+import re
 import sys
+import stat
 import threading
-from typing import List, Dict, Any, Optional, Tuple, Callable
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from types import SimpleNamespace
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable
 from pathlib import Path
+from loguru import logger
 
-from PySide6.QtCore import Qt, QSize, Signal, Slot, QThread, QTimer, QMimeData
-from PySide6.QtGui import QIcon, QPixmap, QDragEnterEvent, QDropEvent, QAction
+from PySide6.QtCore import (
+    Qt, QSize, Signal, Slot, QTimer, QMimeData, QAbstractListModel, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool, QFileSystemWatcher
+)
+from PySide6.QtGui import QIcon, QImage, QImageReader, QPixmap, QPixmapCache, QDragEnterEvent, QDropEvent, QAction
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QCheckBox, QComboBox, QFileDialog,
-    QTableWidget, QTableWidgetItem, QHeaderView, QTextEdit, QMessageBox,
-    QDialog, QFormLayout, QGroupBox, QRadioButton, QSplitter, QListWidget,
-    QListWidgetItem, QProgressBar, QMenu, QSystemTrayIcon, QToolBar, QStatusBar,
-    QSpacerItem, QSizePolicy,QStyle
+    QTableView, QHeaderView, QPlainTextEdit, QMessageBox,
+    QDialog, QFormLayout, QGroupBox, QRadioButton, QSplitter,
+    QListView, QProgressBar, QMenu, QSystemTrayIcon, QToolBar, QStatusBar,
+    QSpacerItem, QSizePolicy, QSpinBox, QStyle
 )
 
-from src.config import Config, FileRule, get_config_path, OrganizeConfig
+from src.config import Config, ConfigError, DUPLICATE_ACTIONS, FileRule, get_config_path, OrganizeConfig
 from src.file_operations import FileOperations, FileInfo
 from src.utils import get_user_documents_dir, get_file_size_str, setup_logger
 
@@ -34,6 +45,8 @@ TRANSLATIONS = {
         "source_dir": "整理元ディレクトリ",
         "browse": "参照",
         "include_subdirs": "サブディレクトリも含める",
+        "max_depth": "階層の上限:",
+        "max_depth_unlimited": "無制限",
         "create_date_folders": "日付フォルダを作成",
         "handle_duplicates": "重複ファイルを処理",
         "duplicate_action": "重複ファイルの処理方法:",
@@ -59,6 +72,8 @@ TRANSLATIONS = {
         "settings_theme": "テーマ",
         "settings_language": "言語",
         "settings_log_level": "ログレベル",
+        "settings_workers": "並列処理数",
+        "settings_workers_auto": "自動",
         "settings_save": "設定保存",
         "settings_reset": "初期設定に戻す",
         "about_title": "ファイル管理自動化ツール",
@@ -98,6 +113,8 @@ TRANSLATIONS = {
         "source_dir": "Source Directory",
         "browse": "Browse",
         "include_subdirs": "Include Subdirectories",
+        "max_depth": "Max Depth:",
+        "max_depth_unlimited": "Unlimited",
         "create_date_folders": "Create Date Folders",
         "handle_duplicates": "Handle Duplicate Files",
         "duplicate_action": "Duplicate Action:",
@@ -123,6 +140,8 @@ TRANSLATIONS = {
         "settings_theme": "Theme",
         "settings_language": "Language",
         "settings_log_level": "Log Level",
+        "settings_workers": "Parallel Workers",
+        "settings_workers_auto": "Auto",
         "settings_save": "Save Settings",
         "settings_reset": "Reset to Default",
         "about_title": "File Management Automation Tool",
@@ -155,172 +174,271 @@ TRANSLATIONS = {
     }
 }
 
-# テーマとQSSマッピング
+class Translation(SimpleNamespace):
+    """1言語分の翻訳文字列（t.キー名で参照する読み取り専用の名前空間）"""
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("翻訳文字列は変更できません")
+
+    def __delattr__(self, name):
+        raise AttributeError("翻訳文字列は変更できません")
+
+# 読み込み時に一度だけ文字列をインターンし、言語ごとの名前空間にしておく
+TRANSLATIONS = {
+    lang: Translation(**{sys.intern(k): sys.intern(v) for k, v in table.items()})
+    for lang, table in TRANSLATIONS.items()
+}
+
+# 選択できる言語（設定タブの構築ごとに作り直さない）
+LANGUAGES = tuple(TRANSLATIONS)
+
+# 選択できるログレベル
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# テーマとQSSファイルのマッピング（Noneはシステムデフォルト）
 THEMES = {
-    "System": "",  # システムデフォルト
-    "Light": """
-        QWidget {
-            background-color: #f0f0f0;
-            color: #333333;
-        }
-        QTabWidget::pane {
-            border: 1px solid #c0c0c0;
-            background-color: #f8f8f8;
-        }
-        QTabBar::tab {
-            background-color: #e0e0e0;
-            padding: 8px 12px;
-            margin-right: 2px;
-            border: 1px solid #c0c0c0;
-            border-bottom: 0px;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-        }
-        QTabBar::tab:selected {
-            background-color: #f8f8f8;
-        }
-        QPushButton {
-            background-color: #e0e0e0;
-            border: 1px solid #c0c0c0;
-            padding: 5px 10px;
-            border-radius: 3px;
-        }
-        QPushButton:hover {
-            background-color: #d0d0d0;
-        }
-        QPushButton:pressed {
-            background-color: #c0c0c0;
-        }
-        QLineEdit, QTextEdit, QComboBox {
-            border: 1px solid #c0c0c0;
-            background-color: white;
-            padding: 3px;
-            border-radius: 2px;
-        }
-    """,
-    "Dark": """
-        QWidget {
-            background-color: #2d2d2d;
-            color: #e0e0e0;
-        }
-        QTabWidget::pane {
-            border: 1px solid #555555;
-            background-color: #353535;
-        }
-        QTabBar::tab {
-            background-color: #3d3d3d;
-            padding: 8px 12px;
-            margin-right: 2px;
-            border: 1px solid #555555;
-            border-bottom: 0px;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-        }
-        QTabBar::tab:selected {
-            background-color: #353535;
-        }
-        QPushButton {
-            background-color: #4d4d4d;
-            border: 1px solid #555555;
-            padding: 5px 10px;
-            border-radius: 3px;
-            color: #e0e0e0;
-        }
-        QPushButton:hover {
-            background-color: #5d5d5d;
-        }
-        QPushButton:pressed {
-            background-color: #3d3d3d;
-        }
-        QLineEdit, QTextEdit, QComboBox {
-            border: 1px solid #555555;
-            background-color: #404040;
-            color: #e0e0e0;
-            padding: 3px;
-            border-radius: 2px;
-        }
-        QTableWidget {
-            background-color: #353535;
-            color: #e0e0e0;
-            gridline-color: #555555;
-        }
-        QTableWidget::item:selected {
-            background-color: #4a6db5;
-        }
-        QHeaderView::section {
-            background-color: #404040;
-            color: #e0e0e0;
-            padding: 5px;
-            border: 1px solid #555555;
-        }
-    """,
-    "Blue": """
-        QWidget {
-            background-color: #f0f8ff;
-            color: #333333;
-        }
-        QTabWidget::pane {
-            border: 1px solid #a0c0e0;
-            background-color: #f8faff;
-        }
-        QTabBar::tab {
-            background-color: #d0e0f0;
-            padding: 8px 12px;
-            margin-right: 2px;
-            border: 1px solid #a0c0e0;
-            border-bottom: 0px;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-        }
-        QTabBar::tab:selected {
-            background-color: #f8faff;
-        }
-        QPushButton {
-            background-color: #d0e0f0;
-            border: 1px solid #a0c0e0;
-            padding: 5px 10px;
-            border-radius: 3px;
-        }
-        QPushButton:hover {
-            background-color: #c0d0e0;
-        }
-        QPushButton:pressed {
-            background-color: #b0c0d0;
-        }
-        QLineEdit, QTextEdit, QComboBox {
-            border: 1px solid #a0c0e0;
-            background-color: white;
-            padding: 3px;
-            border-radius: 2px;
-        }
-    """
+    "System": None,
+    "Light": "light.qss",
+    "Dark": "dark.qss",
+    "Blue": "blue.qss",
 }
 
-# ワーカースレッドクラス
-class Worker(QThread):
-    """バックグラウンド処理を行うワーカースレッド"""
+# 選択できるテーマ名
+THEME_NAMES = tuple(THEMES)
+
+# テーマのQSSファイルを置くディレクトリ
+THEMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "themes")
+
+@lru_cache(maxsize=None)
+def load_theme_qss(theme_name: str) -> str:
+    """テーマのQSSを読み込む（テーマごとに一度だけファイルを読む）"""
+    filename = THEMES.get(theme_name)
+    if not filename:
+        return ""
+    try:
+        with open(os.path.join(THEMES_DIR, filename), encoding="utf-8") as f:
+            return f.read()
+    except OSError as e:
+        logger.warning(f"テーマファイルを読み込めません: {filename} ({e})")
+        return ""
+
+# ドロップエリアのスタイル（dropStateプロパティで切り替え、ドラッグ中に再パースしない）
+DROP_AREA_QSS = """
+    QLabel {
+        border: 2px dashed #aaaaaa;
+        border-radius: 5px;
+        padding: 10px;
+    }
+    QLabel[dropState="active"] {
+        border: 2px dashed #3498db;
+        background-color: rgba(52, 152, 219, 0.1);
+    }
+"""
+
+# プレビューエリアのスタイル
+PREVIEW_AREA_QSS = "background-color: #f0f0f0; border: 1px solid #d0d0d0;"
+
+# バックグラウンドタスク
+# 整理結果の種別ごとのログ行の接頭辞
+ORGANIZE_LOG_PREFIXES = {"success": "✓", "skipped": "-", "error": "✗"}
+
+# 整理中のログをGUIへ送る間隔（行数, 秒）
+ORGANIZE_LOG_BATCH_LINES = 200
+ORGANIZE_LOG_BATCH_SECONDS = 0.1
+
+def organize_files_task(*args, log_callback=None, **kwargs):
+    """ファイル整理を行い、種別ごとの件数を返す
+    
+    結果は1件ずつ受け取って件数を数え、ログ行はワーカースレッド側で整形して
+    一定の行数または時間ごとにまとめてlog_callbackへ渡す。結果の一覧を保持しないため、
+    大量のファイルでもメモリ使用量が増えず、ログも処理の途中から表示される。
+    """
+    counts = dict.fromkeys(ORGANIZE_LOG_PREFIXES, 0)
+    buffer = []
+    last_flush = time.monotonic()
+    
+    for kind, message in FileOperations.iter_organize_files(*args, **kwargs):
+        counts[kind] += 1
+        if log_callback is None:
+            continue
+        buffer.append(f"{ORGANIZE_LOG_PREFIXES[kind]} {message}")
+        now = time.monotonic()
+        if len(buffer) >= ORGANIZE_LOG_BATCH_LINES or now - last_flush >= ORGANIZE_LOG_BATCH_SECONDS:
+            log_callback("\n".join(buffer))
+            buffer.clear()
+            last_flush = now
+    
+    if buffer:
+        log_callback("\n".join(buffer))
+    return counts
+
+class TaskSignals(QObject):
+    """タスクからGUIスレッドへの通知に使うシグナル"""
     # 汎用的なシグナル
     started = Signal()
     finished = Signal(object)
     progress = Signal(int)
-    log = Signal(str, str)  # メッセージ, カラー
+    log = Signal(str)  # 整形済みのログ（複数行可）
     error = Signal(str)
 
-    def __init__(self, task_func, *args, **kwargs):
+class Task(QRunnable):
+    """共有スレッドプール上でバックグラウンド処理を行うタスク
+    
+    タスクごとにスレッドを生成せず、QThreadPool.globalInstance()のスレッドを再利用する。
+    完了までシグナルを受け取れるよう、呼び出し側でタスクへの参照を保持すること。
+    """
+    # 進捗シグナルの最短送出間隔（秒）。描画の更新頻度（約60Hz）を超えて送らない
+    PROGRESS_INTERVAL = 1 / 60
+
+    def __init__(self, task_func, *args, with_progress=False, with_log=False, **kwargs):
         super().__init__()
         self.task_func = task_func
         self.args = args
         self.kwargs = kwargs
         self.result = None
+        self.signals = TaskSignals()
+        self._last_progress = 0.0
+        # 寿命はPython側の参照で管理する
+        self.setAutoDelete(False)
+        
+        # 進捗を報告するタスクにはコールバックを渡す
+        if with_progress:
+            self.kwargs["progress_callback"] = self.report_progress
+        # ログを送るタスクにはlogシグナルの送出関数を渡す
+        if with_log:
+            self.kwargs["log_callback"] = self.signals.log.emit
+
+    def report_progress(self, done, total):
+        """進捗（%）を間引いて通知（完了時は必ず通知）"""
+        now = time.monotonic()
+        if done < total and now - self._last_progress < self.PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        self.signals.progress.emit(done * 100 // total if total else 100)
 
     def run(self):
-        """スレッド実行"""
-        self.started.emit()
+        """タスク実行"""
+        self.signals.started.emit()
         try:
             self.result = self.task_func(*self.args, **self.kwargs)
-            self.finished.emit(self.result)
+            self.signals.finished.emit(self.result)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+# ディレクトリ単位のスキャンタスク
+class DirScanRunnable(QRunnable):
+    """1つのディレクトリをスレッドプール上でスキャンするタスク"""
+
+    class Signals(QObject):
+        finished = Signal(int, object, object)  # シャード番号, ファイル一覧, サブディレクトリ一覧
+        error = Signal(str)
+
+    def __init__(self, index, directory, recurse, list_subdirs=False, max_depth=None):
+        super().__init__()
+        self.index = index
+        self.directory = directory
+        self.recurse = recurse
+        self.list_subdirs = list_subdirs
+        self.max_depth = max_depth
+        self.signals = DirScanRunnable.Signals()
+
+    def run(self):
+        """タスク実行"""
+        try:
+            files = list(FileOperations.iter_directory(self.directory, self.recurse, self.max_depth))
+            subdirs = FileOperations.list_subdirectories(self.directory) if self.list_subdirs else []
+            self.signals.finished.emit(self.index, files, subdirs)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+# サブディレクトリごとに並列でスキャンするコーディネーター
+class ParallelScan(QObject):
+    """スキャン元直下のファイルと各サブディレクトリを別々のタスクとしてスキャンする
+    
+    TaskSignalsと同じ名前のfinished/errorシグナルを持つ。タスクの完了通知はGUIスレッドで
+    受け取るため、残りタスク数の管理にロックは不要。
+    """
+    finished = Signal(object)
+    error = Signal(str)
+
+    def __init__(self, source_dir, include_subdirs, parent=None, max_depth=None):
+        super().__init__(parent)
+        self.source_dir = source_dir
+        self.include_subdirs = include_subdirs
+        self.max_depth = max_depth
+        self.pool = QThreadPool.globalInstance()
+        self.tasks = []
+        self.results = {}
+        self.pending = 0
+        self.failed = False
+
+    def start(self):
+        """スキャン元直下のスキャンから開始（サブディレクトリはその結果から投入）"""
+        # 階層数が0以下ならサブディレクトリはたどらない（iter_directoryと同じ）
+        list_subdirs = self.include_subdirs and (self.max_depth is None or self.max_depth > 0)
+        self._submit(self.source_dir, False, list_subdirs=list_subdirs)
+
+    def _submit(self, directory, recurse, list_subdirs=False, max_depth=None):
+        task = DirScanRunnable(len(self.tasks), directory, recurse, list_subdirs, max_depth)
+        task.setAutoDelete(False)
+        task.signals.finished.connect(self._on_task_finished)
+        task.signals.error.connect(self._on_task_error)
+        self.tasks.append(task)
+        self.pending += 1
+        self.pool.start(task)
+
+    def _on_task_finished(self, index, files, subdirs):
+        self.results[index] = files
+        # サブディレクトリ自体が1階層目なので、その中でたどれる階層は1つ少ない
+        remaining = None if self.max_depth is None else self.max_depth - 1
+        for subdir in subdirs:
+            self._submit(subdir, remaining != 0, max_depth=remaining)
+        
+        self.pending -= 1
+        if self.pending == 0 and not self.failed:
+            # シャードの投入順に連結して結果の順序を安定させる
+            files = [f for i in range(len(self.tasks)) for f in self.results[i]]
+            self.tasks.clear()
+            self.finished.emit(files)
+
+    def _on_task_error(self, error_msg):
+        self.pending -= 1
+        if not self.failed:
+            self.failed = True
+            self.error.emit(error_msg)
+
+# プレビュー画像の読み込みタスク
+class PreviewLoader(QRunnable):
+    """画像を表示サイズに縮小しながらデコードするタスク"""
+
+    class Signals(QObject):
+        ready = Signal(str, QImage)  # キャッシュキー, 縮小済みの画像
+
+    def __init__(self, path, size, cache_key, signals):
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.cache_key = cache_key
+        self.signals = signals
+
+    def run(self):
+        """タスク実行（QPixmapはGUIスレッドでしか扱えないためQImageで返す）"""
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        
+        # デコード時に縮小させ、元の解像度のままメモリに展開しない
+        original_size = reader.size()
+        if original_size.isValid():
+            scaled_size = original_size.scaled(self.size, Qt.KeepAspectRatio)
+            if scaled_size.width() < original_size.width():
+                reader.setScaledSize(scaled_size)
+        
+        image = reader.read()
+        if not image.isNull() and (image.width() > self.size.width() or image.height() > self.size.height()):
+            image = image.scaled(self.size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        
+        self.signals.ready.emit(self.cache_key, image)
 
 # ドラッグ＆ドロップ対応のウィジェット
 class DropArea(QWidget):
@@ -338,57 +456,195 @@ class DropArea(QWidget):
         self.label = QLabel(self)
         self.label.setAlignment(Qt.AlignCenter)
         self.label.setMinimumHeight(100)
-        self.label.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #aaaaaa;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
+        self.label.setStyleSheet(DROP_AREA_QSS)
         
         layout.addWidget(self.label)
         self.setLayout(layout)
 
+    def set_drop_active(self, active: bool):
+        """ドロップ受付中の強調表示を切り替える"""
+        state = "active" if active else ""
+        if self.label.property("dropState") == state:
+            return
+        self.label.setProperty("dropState", state)
+        self.label.style().unpolish(self.label)
+        self.label.style().polish(self.label)
+
     def dragEnterEvent(self, event: QDragEnterEvent):
         """ドラッグ進入イベント"""
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
-            self.label.setStyleSheet("""
-                QLabel {
-                    border: 2px dashed #3498db;
-                    border-radius: 5px;
-                    background-color: rgba(52, 152, 219, 0.1);
-                    padding: 10px;
-                }
-            """)
+            self.set_drop_active(True)
 
     def dragLeaveEvent(self, event):
         """ドラッグ離脱イベント"""
-        self.label.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #aaaaaa;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
+        self.set_drop_active(False)
 
     def dropEvent(self, event: QDropEvent):
         """ドロップイベント"""
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
+                # ローカルファイル以外はstatせずに除外し、最初に見つかったディレクトリを採用
+                if not url.isLocalFile():
+                    continue
                 path = url.toLocalFile()
-                if os.path.isdir(path):
+                try:
+                    is_dir = stat.S_ISDIR(os.stat(path).st_mode)
+                except OSError:
+                    continue
+                if is_dir:
                     self.fileDropped.emit(path)
                     break
             
             # スタイルをリセット
-            self.label.setStyleSheet("""
-                QLabel {
-                    border: 2px dashed #aaaaaa;
-                    border-radius: 5px;
-                    padding: 10px;
-                }
-            """)
+            self.set_drop_active(False)
+
+# ルール一覧の各列の幅の基準にする文字列
+RULE_COLUMN_SAMPLES = ["アーカイブファイル", ".jpg,.jpeg,.png", "^report_\\d+", "ドキュメント/画像", "✓"]
+
+# ルール一覧のテーブルモデル
+class RuleTableModel(QAbstractTableModel):
+    """ファイルルールのリストをそのまま参照するテーブルモデル（セルごとのアイテムを作らない）"""
+
+    def __init__(self, rules: List[FileRule], headers: List[str], parent=None):
+        super().__init__(parent)
+        self.rules = rules
+        self.headers = headers
+        # 行ごとの表示文字列のキャッシュ（id(ルール) -> 各列の文字列）
+        self._display_cache: Dict[int, Tuple[str, ...]] = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rules)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def _display_row(self, rule: FileRule) -> Tuple[str, ...]:
+        """ルールの表示文字列を取得（結合済みの文字列を再利用する）"""
+        row = self._display_cache.get(id(rule))
+        if row is None:
+            row = self._display_cache[id(rule)] = (
+                rule.name,
+                ','.join(rule.extensions),
+                ','.join(rule.patterns),
+                rule.destination,
+                "✓" if rule.enabled else ""
+            )
+        return row
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return self._display_row(self.rules[index.row()])[column]
+        elif role == Qt.TextAlignmentRole and column == 4:
+            return int(Qt.AlignCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def set_rules(self, rules: List[FileRule]):
+        """参照するルールのリストを差し替えて表示を更新"""
+        self.beginResetModel()
+        self.rules = rules
+        self._display_cache.clear()
+        self.endResetModel()
+
+    def append_rule(self, rule: FileRule):
+        """末尾にルールを追加（追加した行だけを通知）"""
+        row = len(self.rules)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rules.append(rule)
+        self.endInsertRows()
+
+    def remove_rule(self, row: int):
+        """指定行のルールを削除（削除した行だけを通知）"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        rule = self.rules.pop(row)
+        self._display_cache.pop(id(rule), None)
+        self.endRemoveRows()
+
+    def rule_changed(self, row: int):
+        """指定行のルールが編集されたことを通知"""
+        self._display_cache.pop(id(self.rules[row]), None)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+# スキャン結果のリストモデル
+class FileListModel(QAbstractListModel):
+    """スキャンしたファイルのリストを参照するモデル（ファイルごとのアイテムを作らない）"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.files: List[FileInfo] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.files)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        file_info = self.files[index.row()]
+        if role == Qt.DisplayRole:
+            return file_info.name
+        if role == Qt.UserRole:
+            return file_info
+        return None
+
+    def set_files(self, files: List[FileInfo]):
+        """参照するファイルのリストを差し替えて表示を更新"""
+        self.beginResetModel()
+        self.files = files
+        self.endResetModel()
+
+    def append_files(self, files: List[FileInfo]):
+        """末尾にファイルを追加"""
+        if not files:
+            return
+        first = len(self.files)
+        self.beginInsertRows(QModelIndex(), first, first + len(files) - 1)
+        self.files.extend(files)
+        self.endInsertRows()
+
+    def remove_files(self, paths: Set[str]):
+        """指定したパスのファイルを削除（連続する行はまとめて削除する）"""
+        row = len(self.files) - 1
+        while row >= 0:
+            if str(self.files[row].path) not in paths:
+                row -= 1
+                continue
+            last = row
+            while row > 0 and str(self.files[row - 1].path) in paths:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row, last)
+            del self.files[row:last + 1]
+            self.endRemoveRows()
+            row -= 1
+
+    def replace_file(self, row: int, file_info: FileInfo):
+        """指定した行のファイル情報を差し替える"""
+        self.files[row] = file_info
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+@lru_cache(maxsize=128)
+def parse_extensions(text: str) -> Tuple[str, ...]:
+    """カンマ区切りの拡張子を、照合時と同じ小文字・ドット付きの形で重複を除いて返す"""
+    extensions = (ext.strip().lower() for ext in text.split(","))
+    return tuple(dict.fromkeys(
+        ext if ext.startswith(".") else "." + ext
+        for ext in extensions if ext
+    ))
+
+@lru_cache(maxsize=128)
+def parse_patterns(text: str) -> Tuple[str, ...]:
+    """カンマ区切りのパターンを、前後の空白を除いて返す（空のものは除外）"""
+    return tuple(pat for pat in (pat.strip() for pat in text.split(",")) if pat)
 
 # ルール編集ダイアログ
 class RuleDialog(QDialog):
@@ -398,7 +654,7 @@ class RuleDialog(QDialog):
         self.rule = rule
         self.t = TRANSLATIONS[lang]
         
-        self.setWindowTitle(self.t["rule_dialog_title"])
+        self.setWindowTitle(self.t.rule_dialog_title)
         self.resize(400, 300)
         
         self.setup_ui()
@@ -416,22 +672,22 @@ class RuleDialog(QDialog):
         
         # ルール名
         self.name_edit = QLineEdit()
-        form_layout.addRow(self.t["enter_rule_name"], self.name_edit)
+        form_layout.addRow(self.t.enter_rule_name, self.name_edit)
         
         # 拡張子
         self.extensions_edit = QLineEdit()
-        form_layout.addRow(self.t["enter_extensions"], self.extensions_edit)
+        form_layout.addRow(self.t.enter_extensions, self.extensions_edit)
         
         # パターン
         self.patterns_edit = QLineEdit()
-        form_layout.addRow(self.t["enter_patterns"], self.patterns_edit)
+        form_layout.addRow(self.t.enter_patterns, self.patterns_edit)
         
         # 保存先
         self.destination_edit = QLineEdit()
-        form_layout.addRow(self.t["enter_destination"], self.destination_edit)
+        form_layout.addRow(self.t.enter_destination, self.destination_edit)
         
         # 有効/無効
-        self.enabled_check = QCheckBox(self.t["rule_enabled"])
+        self.enabled_check = QCheckBox(self.t.rule_enabled)
         self.enabled_check.setChecked(True)
         
         # レイアウトに追加
@@ -440,8 +696,8 @@ class RuleDialog(QDialog):
         
         # ボタン
         button_layout = QHBoxLayout()
-        self.save_button = QPushButton(self.t["save"])
-        self.cancel_button = QPushButton(self.t["cancel"])
+        self.save_button = QPushButton(self.t.save)
+        self.cancel_button = QPushButton(self.t.cancel)
         
         button_layout.addWidget(self.save_button)
         button_layout.addWidget(self.cancel_button)
@@ -474,19 +730,9 @@ class RuleDialog(QDialog):
         """フォームからルールデータを取得"""
         name = self.name_edit.text().strip()
         
-        # 拡張子の処理
-        extensions_text = self.extensions_edit.text().strip()
-        extensions = []
-        if extensions_text:
-            extensions = [ext.strip() for ext in extensions_text.split(",")]
-            # 拡張子の先頭にドットがない場合は追加
-            extensions = [ext if ext.startswith(".") else "." + ext for ext in extensions]
-        
-        # パターンの処理
-        patterns_text = self.patterns_edit.text().strip()
-        patterns = []
-        if patterns_text:
-            patterns = [pat.strip() for pat in patterns_text.split(",")]
+        # 拡張子とパターンの処理
+        extensions = list(parse_extensions(self.extensions_edit.text()))
+        patterns = list(parse_patterns(self.patterns_edit.text()))
         
         # 保存先の処理
         destination = self.destination_edit.text().strip()
@@ -506,13 +752,21 @@ class RuleDialog(QDialog):
         rule_data = self.get_rule_data()
         
         if not rule_data["name"]:
-            QMessageBox.warning(self, self.t["error"], "ルール名を入力してください")
+            QMessageBox.warning(self, self.t.error, "ルール名を入力してください")
             return False
         
         if not rule_data["extensions"] and not rule_data["patterns"]:
-            QMessageBox.warning(self, self.t["error"], "拡張子またはパターンを少なくとも1つ指定してください")
+            QMessageBox.warning(self, self.t.error, "拡張子またはパターンを少なくとも1つ指定してください")
             return False
         
+        # 正規表現として無効なパターンは照合時に無視されるため、保存前に知らせる
+        for pattern in rule_data["patterns"]:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                QMessageBox.warning(self, self.t.error, f"無効なパターンです: {pattern} ({e})")
+                return False
+        
         return True
     
     def accept(self):
@@ -520,6 +774,52 @@ class RuleDialog(QDialog):
         if self.validate():
             super().accept()
         
+# ログ表示に保持する最大行数
+LOG_MAX_LINES = 10000
+
+# プレビュー画像キャッシュの上限（KB）
+PREVIEW_CACHE_LIMIT_KB = 50 * 1024
+
+# テキストプレビューで読み込むバイト数と表示する文字数
+PREVIEW_TEXT_BYTES = 4096
+PREVIEW_TEXT_CHARS = 1000
+
+# プレビュー対象の拡張子
+PREVIEW_IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp"})
+PREVIEW_TEXT_EXTS = frozenset({".txt", ".md", ".csv", ".json", ".xml", ".html", ".py", ".js", ".css"})
+
+# 拡張子 -> プレビュー表示に使うFileOrganizerAppのメソッド名
+PREVIEW_HANDLERS = {
+    **dict.fromkeys(PREVIEW_IMAGE_EXTS, "_show_image_preview"),
+    **dict.fromkeys(PREVIEW_TEXT_EXTS, "_show_text_preview"),
+}
+
+# プレビュー画像の表示サイズを丸める単位（ピクセル）
+PREVIEW_SIZE_STEP = 64
+
+@lru_cache(maxsize=64)
+def read_text_preview(path: str, mtime: float, size: int) -> str:
+    """テキストファイルの先頭を読み込んでプレビュー用の文字列を返す
+    
+    更新時刻とサイズもキーに含め、同じファイルを繰り返し選択した場合は
+    ディスクを読まずにキャッシュから返す。
+    """
+    # 先頭だけをバッファなしで1回読み込む（空ファイルは読まない）
+    raw = b""
+    if size > 0:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, PREVIEW_TEXT_BYTES, os.POSIX_FADV_SEQUENTIAL)
+            raw = os.read(fd, PREVIEW_TEXT_BYTES)
+        finally:
+            os.close(fd)
+    
+    preview_text = raw.decode('utf-8', errors='replace')
+    if len(preview_text) > PREVIEW_TEXT_CHARS or size > len(raw):
+        preview_text = preview_text[:PREVIEW_TEXT_CHARS] + "...\n(プレビューは一部のみ表示しています)"
+    return preview_text
+
 # メインウィンドウクラス
 class FileOrganizerApp(QMainWindow):
     """ファイル管理自動化ツールのメインウィンドウ"""
@@ -541,25 +841,103 @@ class FileOrganizerApp(QMainWindow):
         
         # 翻訳辞書へのショートカット
         self.t = TRANSLATIONS[self.lang]
+        # 言語の切り替え時に設定し直す翻訳文字列（設定関数, 翻訳キー）
+        self._i18n_setters = []
+        
+        # ステータス表示の文字列は連結済みのものを使い回す（言語の切り替え時に作り直す）
+        self._status_texts = {
+            key: self.t.status + getattr(self.t, key)
+            for key in ("ready", "scanning", "organizing", "complete", "error")
+        }
         
         # 作業用変数の初期化
         self.files = []
+        # バックグラウンド処理はすべて共有スレッドプールで実行する
+        # （1コアの環境でも整理タスクとスキャンのタスクが同時に動けるよう最低2スレッド）
+        self.pool = QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(max(2, os.cpu_count() or 1))
+        
+        # 実行中のタスク（完了までシグナルを受け取れるよう参照を保持）
         self.workers = {}
         self.is_running = False
         
+        # プレビュー用の縮小画像キャッシュの上限（KB）
+        QPixmapCache.setCacheLimit(PREVIEW_CACHE_LIMIT_KB)
+        
+        # プレビュー画像の読み込み完了通知
+        self._preview_key = None
+        self._preview_pending = set()
+        self._preview_signals = PreviewLoader.Signals()
+        self._preview_signals.ready.connect(self.on_preview_ready)
+        
+        # ログ出力の一時キュー（一定間隔でまとめてQPlainTextEditに追加する）
+        self._log_queue = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_logs)
+        
+        # ルール編集時の設定保存は少し待ってからまとめて書き込む
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._save_config)
+        QApplication.instance().aboutToQuit.connect(self.flush_config_save)
+        
+        # バックグラウンドでの設定保存（実行中のタスクへの参照と、書き込み済みの世代番号）
+        self._save_tasks = set()
+        self._save_lock = threading.Lock()
+        self._save_generation = 0
+        self._saved_generation = 0
+        # 最後に保存した（または読み込んだ）設定の内容
+        self._last_saved_text = self.config.to_json()
+        
+        # スキャン済みディレクトリの監視（変更されたディレクトリだけを読み直して一覧に反映）
+        self.fs_watcher = QFileSystemWatcher(self)
+        self.fs_watcher.directoryChanged.connect(self.on_watched_directory_changed)
+        self._watched_depths: Dict[str, int] = {}  # スキャンでたどったディレクトリ -> 階層
+        self._watch_max_depth: Optional[int] = 0
+        self._changed_dirs = set()
+        self._watch_timer = QTimer(self)
+        self._watch_timer.setSingleShot(True)
+        self._watch_timer.setInterval(200)
+        self._watch_timer.timeout.connect(self._apply_directory_changes)
+        
         # UIの構築
         self.setup_ui()
         
         # テーマの適用
         self.apply_theme(self.config.theme)
         
+        # システムトレイなど表示に必要ない初期化は初回表示の後に行う（showEvent参照）
+        self.tray_icon = None
+        self._late_init_scheduled = False
+        
+        # 確認ダイアログ（confirm()の初回呼び出し時に作成）
+        self._confirm_box = None
+        
+        # batched_updates()の入れ子の深さ
+        self._batch_depth = 0
+
+    def showEvent(self, event):
+        """ウィンドウ表示時の処理"""
+        super().showEvent(event)
+        
+        # 初回表示の描画が終わってから残りの初期化を行う
+        if not self._late_init_scheduled:
+            self._late_init_scheduled = True
+            QTimer.singleShot(0, self._late_init)
+
+    def _late_init(self):
+        """ウィンドウの初回表示後に行う初期化"""
         # システムトレイの設定
         self.setup_tray_icon()
 
     def setup_ui(self):
         """UIの初期化と構築"""
         # ウィンドウの設定
-        self.setWindowTitle(self.t["app_title"])
+        self.setWindowTitle(self.t.app_title)
+        self.register_text(self.setWindowTitle, "app_title")
         self.resize(900, 700)
         
         # メインウィジェットとレイアウト
@@ -572,20 +950,55 @@ class FileOrganizerApp(QMainWindow):
         self.tab_widget = QTabWidget()
         self.main_layout.addWidget(self.tab_widget)
         
-        # 各タブの作成
+        # 各タブの作成（整理タブ以外は最初に表示されるまで構築を遅延）
         self.create_organize_tab()
-        self.create_rules_tab()
-        self.create_settings_tab()
-        self.create_about_tab()
+        self._tab_builders = {}
+        for label_key, builder in (
+            ("tab_rules", self.create_rules_tab),
+            ("tab_settings", self.create_settings_tab),
+            ("tab_about", self.create_about_tab),
+        ):
+            index = self.tab_widget.addTab(QWidget(), getattr(self.t, label_key))
+            self.register_text(partial(self.tab_widget.setTabText, index), label_key)
+            self._tab_builders[index] = builder
+        # 遅延構築するタブの構築関数（言語の切り替え時に構築済みのタブを作り直す）
+        self._lazy_tabs = dict(self._tab_builders)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
         
         # ステータスバーの設定
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_label = QLabel(self.t["status"] + self.t["ready"])
+        self._status_key = "ready"
+        self.status_label = QLabel(self._status_texts["ready"])
         self.status_bar.addWidget(self.status_label)
 
+    def _ensure_tab_built(self, index):
+        """タブが初めて表示されたときに中身を構築してプレースホルダーと差し替える"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        self._replace_tab(index, builder())
+
+    def _replace_tab(self, index, widget):
+        """タブの中身を差し替える（選択中のタブは変えない）"""
+        old_widget = self.tab_widget.widget(index)
+        label = self.tab_widget.tabText(index)
+        current = self.tab_widget.currentIndex()
+        
+        # 差し替え中のタブ切り替え通知は不要なので止めておく
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, label)
+        self.tab_widget.setCurrentIndex(current)
+        self.tab_widget.blockSignals(False)
+        
+        old_widget.deleteLater()
+
     def create_organize_tab(self):
         """ファイル整理タブの作成"""
+        # 翻訳テーブルはローカル変数に束縛して参照する
+        t = self.t
+        
         organize_widget = QWidget()
         organize_layout = QVBoxLayout(organize_widget)
         
@@ -594,11 +1007,14 @@ class FileOrganizerApp(QMainWindow):
         
         # ソースディレクトリの選択
         source_layout = QHBoxLayout()
-        source_layout.addWidget(QLabel(self.t["source_dir"]))
+        source_label = QLabel(t.source_dir)
+        self.register_text(source_label.setText, "source_dir")
+        source_layout.addWidget(source_label)
         self.source_dir_edit = QLineEdit(self.config.organize_config.source_dir)
         source_layout.addWidget(self.source_dir_edit, 1)
         
-        self.browse_button = QPushButton(self.t["browse"])
+        self.browse_button = QPushButton(t.browse)
+        self.register_text(self.browse_button.setText, "browse")
         self.browse_button.clicked.connect(self.browse_source_dir)
         source_layout.addWidget(self.browse_button)
         
@@ -606,22 +1022,38 @@ class FileOrganizerApp(QMainWindow):
         
         # ドラッグ＆ドロップエリア
         self.drop_area = DropArea()
-        self.drop_area.label.setText(self.t["drag_drop_hint"])
+        self.update_drop_label()
         self.drop_area.fileDropped.connect(self.set_source_dir)
         input_layout.addWidget(self.drop_area)
         
         # オプション設定
         options_layout = QHBoxLayout()
         
-        self.include_subdirs_check = QCheckBox(self.t["include_subdirs"])
+        self.include_subdirs_check = QCheckBox(t.include_subdirs)
+        self.register_text(self.include_subdirs_check.setText, "include_subdirs")
         self.include_subdirs_check.setChecked(self.config.organize_config.process_subdirectories)
         options_layout.addWidget(self.include_subdirs_check)
         
-        self.create_date_folders_check = QCheckBox(self.t["create_date_folders"])
+        # サブディレクトリをたどる階層の上限（0は無制限）
+        max_depth_label = QLabel(t.max_depth)
+        self.register_text(max_depth_label.setText, "max_depth")
+        options_layout.addWidget(max_depth_label)
+        self.max_depth_spin = QSpinBox()
+        self.max_depth_spin.setRange(0, 99)
+        self.max_depth_spin.setSpecialValueText(t.max_depth_unlimited)
+        self.register_text(self.max_depth_spin.setSpecialValueText, "max_depth_unlimited")
+        self.max_depth_spin.setValue(self.config.organize_config.max_depth)
+        self.max_depth_spin.setEnabled(self.include_subdirs_check.isChecked())
+        self.include_subdirs_check.toggled.connect(self.max_depth_spin.setEnabled)
+        options_layout.addWidget(self.max_depth_spin)
+        
+        self.create_date_folders_check = QCheckBox(t.create_date_folders)
+        self.register_text(self.create_date_folders_check.setText, "create_date_folders")
         self.create_date_folders_check.setChecked(self.config.organize_config.create_date_folders)
         options_layout.addWidget(self.create_date_folders_check)
         
-        self.handle_duplicates_check = QCheckBox(self.t["handle_duplicates"])
+        self.handle_duplicates_check = QCheckBox(t.handle_duplicates)
+        self.register_text(self.handle_duplicates_check.setText, "handle_duplicates")
         self.handle_duplicates_check.setChecked(self.config.organize_config.handle_duplicates)
         options_layout.addWidget(self.handle_duplicates_check)
         
@@ -629,19 +1061,19 @@ class FileOrganizerApp(QMainWindow):
         
         # 重複処理オプション
         duplicate_layout = QHBoxLayout()
-        duplicate_layout.addWidget(QLabel(self.t["duplicate_action"]))
+        duplicate_label = QLabel(t.duplicate_action)
+        self.register_text(duplicate_label.setText, "duplicate_action")
+        duplicate_layout.addWidget(duplicate_label)
         
+        # 表示名は翻訳、項目データには設定値を持たせる
         self.duplicate_combo = QComboBox()
-        self.duplicate_combo.addItems([self.t["skip"], self.t["rename"], self.t["move_to_trash"]])
+        for index, action in enumerate(DUPLICATE_ACTIONS):
+            self.duplicate_combo.addItem(getattr(t, action), action)
+            self.register_text(partial(self.duplicate_combo.setItemText, index), action)
         
         # 現在の設定値を選択
-        current_action = self.config.organize_config.duplicate_action
-        if current_action == "skip":
-            self.duplicate_combo.setCurrentText(self.t["skip"])
-        elif current_action == "rename":
-            self.duplicate_combo.setCurrentText(self.t["rename"])
-        elif current_action == "move_to_trash":
-            self.duplicate_combo.setCurrentText(self.t["move_to_trash"])
+        index = self.duplicate_combo.findData(self.config.organize_config.duplicate_action)
+        self.duplicate_combo.setCurrentIndex(max(index, 0))
         
         duplicate_layout.addWidget(self.duplicate_combo)
         duplicate_layout.addStretch(1)
@@ -651,11 +1083,13 @@ class FileOrganizerApp(QMainWindow):
         # ボタン
         buttons_layout = QHBoxLayout()
         
-        self.start_button = QPushButton(self.t["start_organize"])
+        self.start_button = QPushButton(t.start_organize)
+        self.register_text(self.start_button.setText, "start_organize")
         self.start_button.clicked.connect(self.start_organizing)
         buttons_layout.addWidget(self.start_button)
         
-        self.scan_button = QPushButton(self.t["scan_only"])
+        self.scan_button = QPushButton(t.scan_only)
+        self.register_text(self.scan_button.setText, "scan_only")
         self.scan_button.clicked.connect(self.start_scanning)
         buttons_layout.addWidget(self.scan_button)
         
@@ -666,20 +1100,28 @@ class FileOrganizerApp(QMainWindow):
         # 情報表示エリア
         info_layout = QHBoxLayout()
         
-        self.files_found_label = QLabel(self.t["files_found"] + "0")
+        self.files_found_label = QLabel(t.files_found + "0")
         info_layout.addWidget(self.files_found_label)
         
         info_layout.addStretch(1)
         
-        self.success_label = QLabel(self.t["success_count"] + "0")
+        self.success_label = QLabel(t.success_count + "0")
         info_layout.addWidget(self.success_label)
         
-        self.skipped_label = QLabel(self.t["skipped_count"] + "0")
+        self.skipped_label = QLabel(t.skipped_count + "0")
         info_layout.addWidget(self.skipped_label)
         
-        self.error_label = QLabel(self.t["error_count"] + "0")
+        self.error_label = QLabel(t.error_count + "0")
         info_layout.addWidget(self.error_label)
         
+        # 件数表示のラベル（翻訳キー -> (ラベル, 件数)）
+        self._count_labels = {
+            "files_found": [self.files_found_label, 0],
+            "success_count": [self.success_label, 0],
+            "skipped_count": [self.skipped_label, 0],
+            "error_count": [self.error_label, 0],
+        }
+        
         input_layout.addLayout(info_layout)
         
         # プログレスバー
@@ -693,36 +1135,47 @@ class FileOrganizerApp(QMainWindow):
         splitter = QSplitter(Qt.Vertical)
         
         # ログエリア
-        log_group = QGroupBox(self.t["log_title"])
+        log_group = QGroupBox(t.log_title)
+        self.register_text(log_group.setTitle, "log_title")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        # 古い行から破棄してログのメモリ使用量を抑える
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)
+        # 追記のたびに元に戻す履歴を溜めない
+        self.log_text.setUndoRedoEnabled(False)
         log_layout.addWidget(self.log_text)
         
         splitter.addWidget(log_group)
         
         # プレビューエリア
-        preview_group = QGroupBox(self.t["preview"])
+        preview_group = QGroupBox(t.preview)
+        self.register_text(preview_group.setTitle, "preview")
         preview_layout = QHBoxLayout(preview_group)
         
         # ファイルリスト
-        self.file_list = QListWidget()
-        self.file_list.itemClicked.connect(self.show_file_preview)
+        self.file_list_model = FileListModel(self)
+        self.file_list = QListView()
+        self.file_list.setModel(self.file_list_model)
+        self.file_list.setEditTriggers(QListView.NoEditTriggers)
+        # 全行同じ高さとして扱い、行ごとのサイズ計算を省く
+        self.file_list.setUniformItemSizes(True)
+        self.file_list.clicked.connect(self.show_file_preview)
         preview_layout.addWidget(self.file_list, 2)
         
         # プレビュー/情報
         preview_info_layout = QVBoxLayout()
         
         # ファイル情報
-        self.file_info_label = QLabel(self.t["file_info"])
+        self.file_info_label = QLabel(t.file_info)
         preview_info_layout.addWidget(self.file_info_label)
         
         # ファイルプレビュー
         self.preview_area = QLabel()
         self.preview_area.setAlignment(Qt.AlignCenter)
         self.preview_area.setMinimumSize(QSize(200, 200))
-        self.preview_area.setStyleSheet("background-color: #f0f0f0; border: 1px solid #d0d0d0;")
+        self.preview_area.setStyleSheet(PREVIEW_AREA_QSS)
         preview_info_layout.addWidget(self.preview_area)
         
         preview_layout.addLayout(preview_info_layout, 3)
@@ -734,49 +1187,62 @@ class FileOrganizerApp(QMainWindow):
         
         organize_layout.addWidget(splitter)
         
-        self.tab_widget.addTab(organize_widget, self.t["tab_organize"])
+        index = self.tab_widget.addTab(organize_widget, t.tab_organize)
+        self.register_text(partial(self.tab_widget.setTabText, index), "tab_organize")
 
     def create_rules_tab(self):
         """ルール設定タブの作成"""
+        t = self.t
+        
         rules_widget = QWidget()
         rules_layout = QVBoxLayout(rules_widget)
         
-        # ルールテーブル
-        self.rules_table = QTableWidget()
-        self.rules_table.setColumnCount(5)
-        self.rules_table.setHorizontalHeaderLabels([
-            self.t["rule_name"],
-            self.t["rule_extensions"],
-            self.t["rule_patterns"],
-            self.t["rule_destination"],
-            self.t["rule_enabled"]
-        ])
+        # ルールテーブル（設定のルールリストを直接参照するモデル）
+        self.rules_model = RuleTableModel(self.config.file_rules, [
+            t.rule_name,
+            t.rule_extensions,
+            t.rule_patterns,
+            t.rule_destination,
+            t.rule_enabled
+        ], self)
+        self.rules_table = QTableView()
+        self.rules_table.setModel(self.rules_model)
         
         # テーブルの設定
-        self.rules_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.rules_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.rules_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.rules_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        # 列幅は代表的な文字列の幅から一度だけ決め、データ全体を測らない
+        header = self.rules_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        fm = self.rules_table.fontMetrics()
+        for column, sample in enumerate(RULE_COLUMN_SAMPLES):
+            width = max(fm.horizontalAdvance(sample), fm.horizontalAdvance(self.rules_model.headers[column]))
+            self.rules_table.setColumnWidth(column, width + 24)
+        # 拡張子の列で残りの幅を埋める
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        
+        # 行の高さも固定にして、行ごとの内容の計測を行わない
+        vertical_header = self.rules_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(fm.height() + 10)
+        self.rules_table.setSelectionBehavior(QTableView.SelectRows)
+        self.rules_table.setSelectionMode(QTableView.SingleSelection)
+        self.rules_table.setEditTriggers(QTableView.NoEditTriggers)
         self.rules_table.setAlternatingRowColors(True)
         
-        # ルールデータの設定
-        self.update_rules_table()
-        
         rules_layout.addWidget(self.rules_table)
         
         # ボタン
         buttons_layout = QHBoxLayout()
         
-        self.add_rule_button = QPushButton(self.t["add_rule"])
+        self.add_rule_button = QPushButton(t.add_rule)
         self.add_rule_button.clicked.connect(self.add_rule)
         buttons_layout.addWidget(self.add_rule_button)
         
-        self.edit_rule_button = QPushButton(self.t["edit_rule"])
+        self.edit_rule_button = QPushButton(t.edit_rule)
         self.edit_rule_button.clicked.connect(self.edit_rule)
         self.edit_rule_button.setEnabled(False)
         buttons_layout.addWidget(self.edit_rule_button)
         
-        self.delete_rule_button = QPushButton(self.t["delete_rule"])
+        self.delete_rule_button = QPushButton(t.delete_rule)
         self.delete_rule_button.clicked.connect(self.delete_rule)
         self.delete_rule_button.setEnabled(False)
         buttons_layout.addWidget(self.delete_rule_button)
@@ -785,13 +1251,16 @@ class FileOrganizerApp(QMainWindow):
         
         rules_layout.addLayout(buttons_layout)
         
-        # シグナル接続
-        self.rules_table.itemSelectionChanged.connect(self.on_rule_selection_changed)
+        # シグナル接続（選択中の行は選択変更時に記録しておく）
+        self._selected_rule_row = -1
+        self.rules_table.selectionModel().selectionChanged.connect(self.on_rule_selection_changed)
         
-        self.tab_widget.addTab(rules_widget, self.t["tab_rules"])
+        return rules_widget
 
     def create_settings_tab(self):
         """設定タブの作成"""
+        t = self.t
+        
         settings_widget = QWidget()
         settings_layout = QVBoxLayout(settings_widget)
         
@@ -799,32 +1268,39 @@ class FileOrganizerApp(QMainWindow):
         
         # テーマ設定
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(list(THEMES.keys()))
+        self.theme_combo.addItems(THEME_NAMES)
         self.theme_combo.setCurrentText(self.config.theme if self.config.theme in THEMES else "System")
-        form_layout.addRow(self.t["settings_theme"], self.theme_combo)
+        form_layout.addRow(t.settings_theme, self.theme_combo)
         
         # 言語設定
         self.language_combo = QComboBox()
-        self.language_combo.addItems(list(TRANSLATIONS.keys()))
+        self.language_combo.addItems(LANGUAGES)
         self.language_combo.setCurrentText(self.lang)
-        form_layout.addRow(self.t["settings_language"], self.language_combo)
+        form_layout.addRow(t.settings_language, self.language_combo)
         
         # ログレベル設定
         self.log_level_combo = QComboBox()
-        self.log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+        self.log_level_combo.addItems(LOG_LEVELS)
         self.log_level_combo.setCurrentText(self.config.log_level)
-        form_layout.addRow(self.t["settings_log_level"], self.log_level_combo)
+        form_layout.addRow(t.settings_log_level, self.log_level_combo)
+        
+        # 並列処理数の設定（0は自動）
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(0, 64)
+        self.workers_spin.setSpecialValueText(t.settings_workers_auto)
+        self.workers_spin.setValue(self.config.organize_config.max_workers)
+        form_layout.addRow(t.settings_workers, self.workers_spin)
         
         settings_layout.addLayout(form_layout)
         
         # ボタン
         buttons_layout = QHBoxLayout()
         
-        self.save_settings_button = QPushButton(self.t["settings_save"])
+        self.save_settings_button = QPushButton(t.settings_save)
         self.save_settings_button.clicked.connect(self.save_settings)
         buttons_layout.addWidget(self.save_settings_button)
         
-        self.reset_settings_button = QPushButton(self.t["settings_reset"])
+        self.reset_settings_button = QPushButton(t.settings_reset)
         self.reset_settings_button.clicked.connect(self.reset_settings)
         buttons_layout.addWidget(self.reset_settings_button)
         
@@ -833,39 +1309,41 @@ class FileOrganizerApp(QMainWindow):
         settings_layout.addLayout(buttons_layout)
         settings_layout.addStretch(1)
         
-        self.tab_widget.addTab(settings_widget, self.t["tab_settings"])
+        return settings_widget
 
     def create_about_tab(self):
         """このアプリについてタブの作成"""
+        t = self.t
+        
         about_widget = QWidget()
         about_layout = QVBoxLayout(about_widget)
         
         # タイトル
-        title_label = QLabel(self.t["about_title"])
+        title_label = QLabel(t.about_title)
         title_label.setStyleSheet("font-size: 18pt; font-weight: bold;")
         title_label.setAlignment(Qt.AlignCenter)
         about_layout.addWidget(title_label)
         
         # バージョン
-        version_label = QLabel(self.t["about_version"])
+        version_label = QLabel(t.about_version)
         version_label.setAlignment(Qt.AlignCenter)
         about_layout.addWidget(version_label)
         
         # 説明
-        description_label = QLabel(self.t["about_description"])
+        description_label = QLabel(t.about_description)
         description_label.setAlignment(Qt.AlignCenter)
         description_label.setWordWrap(True)
         about_layout.addWidget(description_label)
         
         # 機能
-        features_text = QTextEdit()
+        features_text = QPlainTextEdit()
         features_text.setReadOnly(True)
-        features_text.setPlainText(self.t["about_features"])
+        features_text.setPlainText(t.about_features)
         about_layout.addWidget(features_text)
         
         about_layout.addStretch(1)
         
-        self.tab_widget.addTab(about_widget, self.t["tab_about"])
+        return about_widget
 
     def setup_tray_icon(self):
         """システムトレイアイコンの設定"""
@@ -877,13 +1355,15 @@ class FileOrganizerApp(QMainWindow):
         # トレイメニューの作成
         tray_menu = QMenu()
         
-        restore_action = QAction(self.t["restore"], self)
+        restore_action = QAction(self.t.restore, self)
+        self.register_text(restore_action.setText, "restore")
         restore_action.triggered.connect(self.showNormal)
         tray_menu.addAction(restore_action)
         
         tray_menu.addSeparator()
         
-        exit_action = QAction(self.t["exit"], self)
+        exit_action = QAction(self.t.exit, self)
+        self.register_text(exit_action.setText, "exit")
         exit_action.triggered.connect(QApplication.quit)
         tray_menu.addAction(exit_action)
         
@@ -906,27 +1386,171 @@ class FileOrganizerApp(QMainWindow):
     def closeEvent(self, event):
         """ウィンドウを閉じる時の処理"""
         # トレイに最小化するか終了するか選択
-        if self.tray_icon.isVisible():
-            QMessageBox.information(self, self.t["app_title"],
-                              self.t["app_running"])
+        if self.tray_icon is not None and self.tray_icon.isVisible():
+            QMessageBox.information(self, self.t.app_title,
+                              self.t.app_running)
             self.hide()
             event.ignore()
         else:
+            self.flush_config_save()
             event.accept()
 
+    def confirm(self, message):
+        """はい/いいえの確認ダイアログを表示（ダイアログは初回に作成して使い回す）"""
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(
+                QMessageBox.Question, self.t.confirm, "",
+                QMessageBox.Yes | QMessageBox.No, self
+            )
+            self._confirm_box.setDefaultButton(QMessageBox.No)
+            self.register_text(self._confirm_box.setWindowTitle, "confirm")
+        self._confirm_box.setText(message)
+        return self._confirm_box.exec() == QMessageBox.Yes
+
+    @contextmanager
+    def batched_updates(self):
+        """ブロック内のウィジェット更新を、描画を止めてまとめて反映する（入れ子にできる）"""
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.setUpdatesEnabled(True)
+
+    def set_status(self, key):
+        """ステータス表示を更新"""
+        self._status_key = key
+        self.status_label.setText(self._status_texts[key])
+
+    def set_count(self, key, count):
+        """件数表示のラベルを更新"""
+        entry = self._count_labels[key]
+        entry[1] = count
+        entry[0].setText(getattr(self.t, key) + str(count))
+
+    def register_text(self, setter, key):
+        """言語の切り替え時に設定し直す翻訳文字列を登録"""
+        self._i18n_setters.append((setter, key))
+
+    def update_drop_label(self):
+        """ドロップエリアの表示を更新（選択中のディレクトリ名を併記）"""
+        text = self.t.drag_drop_hint
+        source_dir = self.source_dir_edit.text()
+        if source_dir:
+            text = f"{text}\n{os.path.basename(source_dir)}"
+        self.drop_area.label.setText(text)
+
+    def set_language(self, lang):
+        """表示言語を切り替える（再起動せずに表示中の文字列を差し替える）"""
+        old_t = self.t
+        self.lang = lang
+        self.t = t = TRANSLATIONS[lang]
+        
+        with self.batched_updates():
+            # 登録済みの文字列
+            for setter, key in self._i18n_setters:
+                setter(getattr(t, key))
+            
+            # ステータスと件数の表示
+            self._status_texts = {
+                key: t.status + getattr(t, key)
+                for key in ("ready", "scanning", "organizing", "complete", "error")
+            }
+            self.set_status(self._status_key)
+            for key, (label, count) in self._count_labels.items():
+                label.setText(getattr(t, key) + str(count))
+            
+            self.update_drop_label()
+            if self.file_info_label.text() == old_t.file_info:
+                self.file_info_label.setText(t.file_info)
+            
+            # 構築済みの遅延タブは新しい言語で作り直す
+            for index, builder in self._lazy_tabs.items():
+                if index not in self._tab_builders:
+                    self._replace_tab(index, builder())
+
+    def schedule_config_save(self):
+        """設定の保存を予約（連続した変更は1回の書き込みにまとめる）"""
+        self._save_timer.start()
+
+    def flush_config_save(self):
+        """予約中の設定保存があれば、その場で（同期的に）書き込む"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            text = self.config.to_json()
+            if text == self._last_saved_text:
+                return
+            self._last_saved_text = text
+            self._save_generation += 1
+            try:
+                self._write_config(self.config, text, self._save_generation)
+            except ConfigError as e:
+                self._last_saved_text = None
+                logger.error(str(e))
+
+    def _save_config(self):
+        """設定の保存をスレッドプールで実行
+        
+        設定の内容はGUIスレッドで文字列にしておき、ファイルへの書き込みだけを
+        バックグラウンドで行う。
+        """
+        self._save_timer.stop()
+        
+        # 前回保存した内容から変わっていなければ書き込まない
+        text = self.config.to_json()
+        if text == self._last_saved_text:
+            return
+        self._last_saved_text = text
+        self._save_generation += 1
+        
+        task = Task(self._write_config, self.config, text, self._save_generation)
+        task.signals.finished.connect(lambda _: self._save_tasks.discard(task))
+        task.signals.error.connect(lambda msg: self._on_config_save_error(task, msg))
+        self._save_tasks.add(task)
+        self.pool.start(task)
+
+    def _on_config_save_error(self, task, error_msg):
+        """バックグラウンドでの設定保存の失敗時の処理（次回は内容が同じでも書き込む）"""
+        self._save_tasks.discard(task)
+        self._last_saved_text = None
+        logger.error(error_msg)
+
+    def _write_config(self, config, text, generation):
+        """設定の内容をファイルに書き込む（ワーカースレッドからも呼ばれる）"""
+        with self._save_lock:
+            # 後から作成された内容がすでに書き込まれていれば古い内容で上書きしない
+            if generation <= self._saved_generation:
+                return
+            config.save(self.config_path, text)
+            self._saved_generation = generation
+
     def apply_theme(self, theme_name):
-        """テーマの適用"""
-        if theme_name in THEMES:
-            self.setStyleSheet(THEMES[theme_name])
-        else:
-            self.setStyleSheet(THEMES["System"])  # デフォルトテーマ
+        """テーマの適用（未知のテーマ名はシステムデフォルト）"""
+        qss = load_theme_qss(theme_name)
+        
+        # 同じスタイルシートの再設定でも全ウィジェットが再適用されるため省略する
+        if qss == self.styleSheet():
+            return
+        self.setStyleSheet(qss)
 
     def browse_source_dir(self):
         """ソースディレクトリを参照"""
+        # ネットワークドライブ等で遅くならないよう、エントリごとのアイコン取得や
+        # シンボリックリンクの解決を行わない
+        options = (
+            QFileDialog.ShowDirsOnly
+            | QFileDialog.DontUseCustomDirectoryIcons
+            | QFileDialog.DontResolveSymlinks
+            | QFileDialog.ReadOnly
+        )
         dir_path = QFileDialog.getExistingDirectory(
             self, 
-            self.t["select_directory"],
-            self.source_dir_edit.text() or get_user_documents_dir()
+            self.t.select_directory,
+            self.source_dir_edit.text() or get_user_documents_dir(),
+            options
         )
         
         if dir_path:
@@ -937,42 +1561,28 @@ class FileOrganizerApp(QMainWindow):
         self.source_dir_edit.setText(dir_path)
         
         # ドロップエリアのテキスト更新
-        self.drop_area.label.setText(f"{self.t['drag_drop_hint']}\n{os.path.basename(dir_path)}")
+        self.update_drop_label()
 
     def update_rules_table(self):
         """ルールテーブルの更新"""
-        self.rules_table.setRowCount(0)
+        self.rules_model.set_rules(self.config.file_rules)
         
-        for i, rule in enumerate(self.config.file_rules):
-            self.rules_table.insertRow(i)
-            
-            # ルール名
-            self.rules_table.setItem(i, 0, QTableWidgetItem(rule.name))
-            
-            # 拡張子
-            self.rules_table.setItem(i, 1, QTableWidgetItem(','.join(rule.extensions)))
-            
-            # パターン
-            self.rules_table.setItem(i, 2, QTableWidgetItem(','.join(rule.patterns)))
-            
-            # 保存先
-            self.rules_table.setItem(i, 3, QTableWidgetItem(rule.destination))
-            
-            # 有効/無効
-            enabled_item = QTableWidgetItem("✓" if rule.enabled else "")
-            enabled_item.setTextAlignment(Qt.AlignCenter)
-            self.rules_table.setItem(i, 4, enabled_item)
+        # モデルのリセットでは選択変更が通知されないためボタンの状態を更新
+        self.on_rule_selection_changed()
 
     def on_rule_selection_changed(self):
         """ルール選択時の処理"""
         selected_rows = self.rules_table.selectionModel().selectedRows()
+        row = selected_rows[0].row() if selected_rows else -1
         
-        if selected_rows:
-            self.edit_rule_button.setEnabled(True)
-            self.delete_rule_button.setEnabled(True)
-        else:
-            self.edit_rule_button.setEnabled(False)
-            self.delete_rule_button.setEnabled(False)
+        # 選択行が変わっていなければボタンの状態も変わらない
+        if row == self._selected_rule_row:
+            return
+        self._selected_rule_row = row
+        
+        has_selection = row >= 0
+        self.edit_rule_button.setEnabled(has_selection)
+        self.delete_rule_button.setEnabled(has_selection)
 
     def add_rule(self):
         """新しいルールを追加"""
@@ -989,18 +1599,15 @@ class FileOrganizerApp(QMainWindow):
                 destination=rule_data["destination"],
                 enabled=rule_data["enabled"]
             )
-            # ルールリストに追加
-            self.config.file_rules.append(new_rule)
-            self.config.save(self.config_path)
-            # テーブルの更新
-            self.update_rules_table()
+            # ルールリストに追加（モデル経由で追加した行だけを更新）
+            self.rules_model.append_rule(new_rule)
+            self.schedule_config_save()
 
     def edit_rule(self):
         """既存のルールを編集"""
-        selected_rows = self.rules_table.selectionModel().selectedRows()
-        if not selected_rows:
+        row_index = self._selected_rule_row
+        if row_index < 0:
             return
-        row_index = selected_rows[0].row()
         rule = self.config.file_rules[row_index]
         dialog = RuleDialog(self, rule=rule, lang=self.lang)
         if dialog.exec_():
@@ -1013,38 +1620,56 @@ class FileOrganizerApp(QMainWindow):
             rule.enabled = rule_data["enabled"]
             
             # 設定の保存
-            self.config.save(self.config_path)
+            self.schedule_config_save()
             
-            # テーブルの更新
-            self.update_rules_table()
+            # 編集した行だけを更新
+            self.rules_model.rule_changed(row_index)
 
     def delete_rule(self):
         """ルールを削除"""
-        selected_rows = self.rules_table.selectionModel().selectedRows()
-        
-        if not selected_rows:
+        row_index = self._selected_rule_row
+        if row_index < 0:
             return
         
-        row_index = selected_rows[0].row()
         rule = self.config.file_rules[row_index]
         
         # 削除確認
-        reply = QMessageBox.question(
-            self, 
-            self.t["confirm"],
-            f"ルール「{rule.name}」を削除しますか？",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            del self.config.file_rules[row_index]
-            self.config.save(self.config_path)
-            self.update_rules_table()
+        if self.confirm(f"ルール「{rule.name}」を削除しますか？"):
+            self.rules_model.remove_rule(row_index)
+            self.schedule_config_save()
             
-            # 選択解除のためボタンを無効化
-            self.edit_rule_button.setEnabled(False)
-            self.delete_rule_button.setEnabled(False)
+            # 削除後に隣の行が選択されないよう選択を解除（ボタンも無効化される）
+            self.rules_table.clearSelection()
+            self.on_rule_selection_changed()
+
+    def append_log(self, message):
+        """ログにメッセージを追加（表示への反映はタイマーでまとめて行う）"""
+        self._log_queue.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def append_logs(self, messages):
+        """複数のメッセージをまとめてログに追加"""
+        self._log_queue.extend(messages)
+        if self._log_queue and not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def clear_log(self):
+        """ログ表示と未反映のメッセージをクリア"""
+        self._log_queue.clear()
+        self._log_timer.stop()
+        self.log_text.clear()
+
+    def _flush_logs(self):
+        """キューに溜まったメッセージを1回の追加でログに反映"""
+        if not self._log_queue:
+            return
+        batch = list(self._log_queue)
+        self._log_queue.clear()
+        
+        self.log_text.setUpdatesEnabled(False)
+        self.log_text.appendPlainText("\n".join(batch))
+        self.log_text.setUpdatesEnabled(True)
 
     def start_scanning(self):
         """スキャン処理を開始"""
@@ -1053,38 +1678,40 @@ class FileOrganizerApp(QMainWindow):
         
         source_dir = self.source_dir_edit.text()
         if not source_dir or not os.path.isdir(source_dir):
-            QMessageBox.warning(self, self.t["error"], "有効なディレクトリを選択してください")
+            QMessageBox.warning(self, self.t.error, "有効なディレクトリを選択してください")
             return
         
         include_subdirs = self.include_subdirs_check.isChecked()
         
         # UI更新
-        self.status_label.setText(self.t["status"] + self.t["scanning"])
-        self.log_text.clear()
-        self.file_list.clear()
-        self.preview_area.clear()
-        self.file_info_label.setText(self.t["file_info"])
-        self.files_found_label.setText(self.t["files_found"] + "0")
-        
-        # プログレスバー表示
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # 不定のプログレス
+        with self.batched_updates():
+            self.set_status("scanning")
+            self.clear_log()
+            self.file_list_model.set_files([])
+            self.preview_area.clear()
+            self.file_info_label.setText(self.t.file_info)
+            self.set_count("files_found", 0)
+            
+            # プログレスバー表示
+            self.progress_bar.setVisible(True)
+            self.progress_bar.setRange(0, 0)  # 不定のプログレス
         
-        # フラグ設定
+        # フラグ設定（処理中のファイル変更は監視しない）
         self.is_running = True
+        self.stop_watching()
         
-        # スキャン処理をワーカースレッドで実行
-        worker = Worker(FileOperations.scan_directory, source_dir, include_subdirs)
-        worker.started.connect(self.on_scanning_started)
-        worker.finished.connect(self.on_scanning_finished)
-        worker.error.connect(self.on_worker_error)
+        # スキャン処理をサブディレクトリごとにスレッドプールで実行
+        scan = ParallelScan(source_dir, include_subdirs, self, max_depth=self.max_depth_spin.value() or None)
+        scan.finished.connect(self.on_scanning_finished)
+        scan.error.connect(self.on_worker_error)
         
-        self.workers["scan"] = worker
-        worker.start()
+        self.workers["scan"] = scan
+        self.on_scanning_started()
+        scan.start()
 
     def on_scanning_started(self):
         """スキャン開始時の処理"""
-        self.log_text.append("ファイルをスキャンしています...")
+        self.append_log("ファイルをスキャンしています...")
         self.start_button.setEnabled(False)
         self.scan_button.setEnabled(False)
 
@@ -1094,11 +1721,11 @@ class FileOrganizerApp(QMainWindow):
         self.is_running = False
         
         # UI更新
-        self.status_label.setText(self.t["status"] + self.t["complete"])
-        self.files_found_label.setText(self.t["files_found"] + str(len(files)))
+        self.set_status("complete")
+        self.set_count("files_found", len(files))
         self.progress_bar.setVisible(False)
         
-        self.log_text.append(f"{len(files)}個のファイルが見つかりました")
+        self.append_log(f"{len(files)}個のファイルが見つかりました")
         
         # ボタンの有効化
         self.start_button.setEnabled(True)
@@ -1106,19 +1733,121 @@ class FileOrganizerApp(QMainWindow):
         
         # ファイルリストの更新
         self.update_file_list()
+        
+        # 以降の変更は監視で差分だけを反映する
+        max_depth = (self.max_depth_spin.value() or None) if self.include_subdirs_check.isChecked() else 0
+        self.watch_directories(self.source_dir_edit.text(), max_depth)
+
+    def watch_directories(self, source_dir, max_depth):
+        """スキャンでたどったディレクトリ（スキャン元からmax_depth階層まで）の監視を開始"""
+        self.stop_watching()
+        self._watch_max_depth = max_depth
+        self.fs_watcher.addPaths(self._visit_directories(source_dir, 0))
+
+    def _visit_directories(self, directory, depth):
+        """directory以下の階層制限内のディレクトリを登録し、新しく登録したものを返す"""
+        visited = []
+        pending = deque([(os.path.normpath(directory), depth)])
+        while pending:
+            directory, depth = pending.popleft()
+            if directory in self._watched_depths:
+                continue
+            self._watched_depths[directory] = depth
+            visited.append(directory)
+            if self._watch_max_depth is None or depth < self._watch_max_depth:
+                pending.extend(
+                    (os.path.normpath(subdir), depth + 1)
+                    for subdir in FileOperations.list_subdirectories(directory)
+                )
+        return visited
+
+    def stop_watching(self):
+        """ディレクトリの監視を停止"""
+        self._watch_timer.stop()
+        self._changed_dirs.clear()
+        self._watched_depths.clear()
+        watched = self.fs_watcher.directories()
+        if watched:
+            self.fs_watcher.removePaths(watched)
+
+    def on_watched_directory_changed(self, path):
+        """監視中のディレクトリの変更通知（短時間の連続した変更はまとめて処理する）"""
+        self._changed_dirs.add(os.path.normpath(path))
+        self._watch_timer.start()
+
+    def _apply_directory_changes(self):
+        """変更されたディレクトリだけを読み直し、ファイル一覧に差分を反映"""
+        changed_dirs = self._changed_dirs
+        self._changed_dirs = set()
+        if self.is_running or not changed_dirs:
+            return
+        
+        model = self.file_list_model
+        # 一覧のファイルをディレクトリごとに分類（パス -> 行番号）
+        known = defaultdict(dict)
+        for row, file_info in enumerate(model.files):
+            path = str(file_info.path)
+            known[os.path.normpath(os.path.dirname(path))][path] = row
+        
+        removed = set()
+        added = {}
+        new_dirs = []
+        for directory in changed_dirs:
+            depth = self._watched_depths.get(directory)
+            if depth is None:
+                continue
+            
+            current = {}
+            if os.path.isdir(directory):
+                current = {
+                    str(file_info.path): file_info
+                    for file_info in FileOperations.iter_directory(directory, False)
+                }
+                # スキャンでたどっていない新しいサブディレクトリは、残りの階層数の範囲で読み込む
+                if self._watch_max_depth is None or depth < self._watch_max_depth:
+                    for subdir in FileOperations.list_subdirectories(directory):
+                        new_dirs.extend(self._visit_directories(subdir, depth + 1))
+            else:
+                # 削除されたディレクトリは配下も含めて登録から外す（作り直されたら新規として読む）
+                prefix = os.path.join(directory, "")
+                for watched in [d for d in self._watched_depths if d == directory or d.startswith(prefix)]:
+                    del self._watched_depths[watched]
+            
+            rows = known.get(directory, {})
+            removed.update(path for path in rows if path not in current)
+            for path, file_info in current.items():
+                row = rows.get(path)
+                if row is None:
+                    added[path] = file_info
+                else:
+                    old = model.files[row]
+                    if old.size != file_info.size or old.modified_time != file_info.modified_time:
+                        model.replace_file(row, file_info)
+        
+        if new_dirs:
+            self.fs_watcher.addPaths(new_dirs)
+            for subdir in new_dirs:
+                rows = known.get(subdir, {})
+                for file_info in FileOperations.iter_directory(subdir, False):
+                    path = str(file_info.path)
+                    if path not in rows:
+                        added[path] = file_info
+        
+        if not removed and not added:
+            return
+        
+        model.remove_files(removed)
+        model.append_files(list(added.values()))
+        self.files = model.files
+        self.set_count("files_found", len(self.files))
 
     def update_file_list(self):
         """ファイルリストの更新"""
-        self.file_list.clear()
-        
-        for file_info in self.files:
-            item = QListWidgetItem(file_info.name)
-            item.setData(Qt.UserRole, file_info)
-            self.file_list.addItem(item)
+        self.file_list_model.set_files(self.files)
 
-    def show_file_preview(self, item):
+    def show_file_preview(self, index):
         """ファイルプレビューの表示"""
-        file_info = item.data(Qt.UserRole)
+        file_info = index.data(Qt.UserRole)
         
         if not file_info:
             return
@@ -1139,40 +1868,70 @@ class FileOrganizerApp(QMainWindow):
         """ファイルの種類に応じたプレビュー表示"""
         self.preview_area.clear()
         
-        # 画像ファイルの場合
-        image_exts = [".jpg", ".jpeg", ".png", ".gif", ".bmp"]
-        if file_info.extension.lower() in image_exts:
-            pixmap = QPixmap(str(file_info.path))
-            if not pixmap.isNull():
-                # サイズ調整
-                pixmap = pixmap.scaled(
-                    self.preview_area.width(), 
-                    self.preview_area.height(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.preview_area.setPixmap(pixmap)
-                return
+        # 拡張子からプレビュー方法を1回の辞書引きで決める
+        handler = PREVIEW_HANDLERS.get(file_info.extension.lower(), "_show_no_preview")
+        getattr(self, handler)(file_info)
+
+    def _show_image_preview(self, file_info):
+        """画像ファイルのプレビュー表示"""
+        # 表示サイズを一定の単位に丸め、多少のリサイズではキャッシュが効くようにする
+        area = self.preview_area.size()
+        size = QSize(
+            max(PREVIEW_SIZE_STEP, area.width() // PREVIEW_SIZE_STEP * PREVIEW_SIZE_STEP),
+            max(PREVIEW_SIZE_STEP, area.height() // PREVIEW_SIZE_STEP * PREVIEW_SIZE_STEP),
+        )
         
-        # テキストファイルの場合
-        text_exts = [".txt", ".md", ".csv", ".json", ".xml", ".html", ".py", ".js", ".css"]
-        if file_info.extension.lower() in text_exts:
-            try:
-                with open(file_info.path, 'r', encoding='utf-8') as f:
-                    preview_text = f.read(1000)  # 先頭1000文字だけ読み込む
-                    if len(preview_text) == 1000:
-                        preview_text += "...\n(プレビューは一部のみ表示しています)"
-                
-                self.preview_area.setText(preview_text)
-                self.preview_area.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-                return
-            except:
-                pass
+        # 同じファイル・同じ表示サイズの縮小画像はキャッシュから取得
+        cache_key = f"{file_info.path}:{file_info.modified_time.timestamp()}:{file_info.size}:{size.width()}x{size.height()}"
+        self._preview_key = cache_key
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None:
+            self.preview_area.setPixmap(pixmap)
+            return
+        
+        # デコードと縮小はスレッドプールで行い、完了後にon_preview_readyで表示
+        self.preview_area.setText("読み込み中...")
+        self.preview_area.setAlignment(Qt.AlignCenter)
+        # 同じ画像を読み込み中であれば重ねて読み込まない
+        if cache_key not in self._preview_pending:
+            self._preview_pending.add(cache_key)
+            self.pool.start(
+                PreviewLoader(str(file_info.path), size, cache_key, self._preview_signals)
+            )
+
+    def _show_text_preview(self, file_info):
+        """テキストファイルのプレビュー表示"""
+        try:
+            preview_text = read_text_preview(
+                str(file_info.path), file_info.modified_time.timestamp(), file_info.size
+            )
+        except OSError:
+            self._show_no_preview(file_info)
+            return
         
-        # その他のファイル
+        self.preview_area.setText(preview_text)
+        self.preview_area.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+
+    def _show_no_preview(self, file_info):
+        """プレビューできないファイルの表示"""
         self.preview_area.setText(f"プレビューは利用できません: {file_info.extension}")
         self.preview_area.setAlignment(Qt.AlignCenter)
 
+    def on_preview_ready(self, cache_key, image):
+        """バックグラウンドで読み込んだプレビュー画像の表示"""
+        self._preview_pending.discard(cache_key)
+        if image.isNull():
+            if cache_key == self._preview_key:
+                self.preview_area.setText("プレビューを読み込めませんでした")
+            return
+        
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(cache_key, pixmap)
+        
+        # 読み込み中に別のファイルが選択された場合は表示しない
+        if cache_key == self._preview_key:
+            self.preview_area.setPixmap(pixmap)
+
     def start_organizing(self):
         """ファイル整理処理を開始"""
         if self.is_running:
@@ -1180,7 +1939,7 @@ class FileOrganizerApp(QMainWindow):
         
         source_dir = self.source_dir_edit.text()
         if not source_dir or not os.path.isdir(source_dir):
-            QMessageBox.warning(self, self.t["error"], "有効なディレクトリを選択してください")
+            QMessageBox.warning(self, self.t.error, "有効なディレクトリを選択してください")
             return
         
         include_subdirs = self.include_subdirs_check.isChecked()
@@ -1188,48 +1947,52 @@ class FileOrganizerApp(QMainWindow):
         handle_duplicates = self.handle_duplicates_check.isChecked()
         
         # 重複処理の設定
-        duplicate_action_text = self.duplicate_combo.currentText()
-        duplicate_action = "skip"
-        if duplicate_action_text == self.t["rename"]:
-            duplicate_action = "rename"
-        elif duplicate_action_text == self.t["move_to_trash"]:
-            duplicate_action = "move_to_trash"
+        duplicate_action = self.duplicate_combo.currentData()
         
         # 設定の更新
         self.config.organize_config.source_dir = source_dir
         self.config.organize_config.process_subdirectories = include_subdirs
+        self.config.organize_config.max_depth = self.max_depth_spin.value()
         self.config.organize_config.create_date_folders = create_date_folders
         self.config.organize_config.handle_duplicates = handle_duplicates
         self.config.organize_config.duplicate_action = duplicate_action
-        self.config.save(self.config_path)
-        
-        # ログのクリア
-        self.log_text.clear()
-        self.success_label.setText(self.t["success_count"] + "0")
-        self.skipped_label.setText(self.t["skipped_count"] + "0")
-        self.error_label.setText(self.t["error_count"] + "0")
-        
-        # ステータス更新
-        self.status_label.setText(self.t["status"] + self.t["organizing"])
-        
-        # プログレスバー表示
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # 不定のプログレス
+        self._save_config()
+        
+        with self.batched_updates():
+            # ログのクリア
+            self.clear_log()
+            self.set_count("success_count", 0)
+            self.set_count("skipped_count", 0)
+            self.set_count("error_count", 0)
+            
+            # ステータス更新
+            self.set_status("organizing")
+            
+            # プログレスバー表示
+            self.progress_bar.setVisible(True)
+            self.progress_bar.setRange(0, 0)  # 不定のプログレス
         
-        # フラグ設定
+        # フラグ設定（処理中のファイル変更は監視しない）
         self.is_running = True
+        self.stop_watching()
         
         # ファイルのスキャンが必要な場合
         if not self.files:
-            self.log_text.append("ファイルをスキャンしています...")
+            self.append_log("ファイルをスキャンしています...")
             
-            # スキャン処理をワーカースレッドで実行
-            scan_worker = Worker(FileOperations.scan_directory, source_dir, include_subdirs)
-            scan_worker.finished.connect(lambda files: self.organize_files(files, source_dir, create_date_folders, handle_duplicates, duplicate_action))
-            scan_worker.error.connect(self.on_worker_error)
+            # スキャン処理をサブディレクトリごとにスレッドプールで実行
+            scan = ParallelScan(source_dir, include_subdirs, self, max_depth=self.max_depth_spin.value() or None)
+            scan.finished.connect(partial(
+                self.organize_files,
+                source_dir=source_dir,
+                create_date_folders=create_date_folders,
+                handle_duplicates=handle_duplicates,
+                duplicate_action=duplicate_action
+            ))
+            scan.error.connect(self.on_worker_error)
             
-            self.workers["scan"] = scan_worker
-            scan_worker.start()
+            self.workers["scan"] = scan
+            scan.start()
         else:
             # すでにスキャン済みの場合は直接整理処理を開始
             self.organize_files(self.files, source_dir, create_date_folders, handle_duplicates, duplicate_action)
@@ -1238,80 +2001,79 @@ class FileOrganizerApp(QMainWindow):
         """ファイル整理処理の実行"""
         if not files:
             self.is_running = False
-            self.status_label.setText(self.t["status"] + self.t["error"])
-            self.log_text.append("エラー: ファイルが見つかりませんでした")
+            self.set_status("error")
+            self.append_log("エラー: ファイルが見つかりませんでした")
             self.progress_bar.setVisible(False)
             self.start_button.setEnabled(True)
             self.scan_button.setEnabled(True)
             return
         
         self.files = files
-        self.files_found_label.setText(self.t["files_found"] + str(len(files)))
-        self.log_text.append(f"{len(files)}個のファイルを整理します...")
+        self.set_count("files_found", len(files))
+        self.append_log(f"{len(files)}個のファイルを整理します...")
         
-        # 整理処理をワーカースレッドで実行
-        worker = Worker(
-            FileOperations.organize_files,
+        # 整理処理を共有スレッドプールで実行
+        task = Task(
+            organize_files_task,
             files,
             self.config.file_rules,
             source_dir,
             create_date_folders,
             handle_duplicates,
-            duplicate_action
+            duplicate_action,
+            max_workers=self.config.organize_config.max_workers,
+            with_progress=True,
+            with_log=True
         )
-        worker.started.connect(self.on_organizing_started)
-        worker.finished.connect(self.on_organizing_finished)
-        worker.error.connect(self.on_worker_error)
-        
-        self.workers["organize"] = worker
-        worker.start()
+        task.signals.started.connect(self.on_organizing_started)
+        task.signals.progress.connect(self.on_organizing_progress)
+        task.signals.log.connect(self.append_log)
+        task.signals.finished.connect(self.on_organizing_finished)
+        task.signals.error.connect(self.on_worker_error)
+        
+        self.workers["organize"] = task
+        self.pool.start(task)
 
     def on_organizing_started(self):
         """整理開始時の処理"""
         self.start_button.setEnabled(False)
         self.scan_button.setEnabled(False)
 
-    def on_organizing_finished(self, result):
-        """整理完了時の処理"""
+    def on_organizing_progress(self, percent):
+        """整理の進捗表示"""
+        if self.progress_bar.maximum() == 0:
+            self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(percent)
+
+    def on_organizing_finished(self, counts):
+        """整理完了時の処理（ログは処理中に追加済み）"""
         self.is_running = False
         
-        # UI更新
-        self.status_label.setText(self.t["status"] + self.t["complete"])
-        self.progress_bar.setVisible(False)
-        
-        # ボタンの有効化
-        self.start_button.setEnabled(True)
-        self.scan_button.setEnabled(True)
-        
-        # 結果の表示
-        success_count = len(result["success"])
-        skipped_count = len(result["skipped"])
-        error_count = len(result["error"])
-        
-        self.success_label.setText(self.t["success_count"] + str(success_count))
-        self.skipped_label.setText(self.t["skipped_count"] + str(skipped_count))
-        self.error_label.setText(self.t["error_count"] + str(error_count))
-        
-        # ログ出力
-        for msg in result["success"]:
-            self.log_text.append(f"✓ {msg}")
-        
-        for msg in result["skipped"]:
-            self.log_text.append(f"- {msg}")
-        
-        for msg in result["error"]:
-            self.log_text.append(f"✗ {msg}")
-        
-        # ファイルリストをクリア（処理済み）
-        self.files = []
-        self.file_list.clear()
+        # 完了時の一連の更新は描画を止めてまとめて反映する
+        with self.batched_updates():
+            # UI更新
+            self.set_status("complete")
+            self.progress_bar.setVisible(False)
+            
+            # ボタンの有効化
+            self.start_button.setEnabled(True)
+            self.scan_button.setEnabled(True)
+            
+            # 結果の表示
+            self.set_count("success_count", counts["success"])
+            self.set_count("skipped_count", counts["skipped"])
+            self.set_count("error_count", counts["error"])
+            
+            # ファイルリストをクリア（処理済み）
+            self.files = []
+            self.file_list_model.set_files([])
 
     def on_worker_error(self, error_msg):
         """ワーカーエラー時の処理"""
         self.is_running = False
         
         # UI更新
-        self.status_label.setText(self.t["status"] + self.t["error"])
+        self.set_status("error")
         self.progress_bar.setVisible(False)
         
         # ボタンの有効化
@@ -1319,14 +2081,10 @@ class FileOrganizerApp(QMainWindow):
         self.scan_button.setEnabled(True)
         
         # エラーログ
-        self.log_text.append(f"エラー: {error_msg}")
+        self.append_log(f"エラー: {error_msg}")
 
     def save_settings(self):
         """設定を保存"""
-        # 現在の設定を保存
-        old_lang = self.lang
-        old_theme = self.config.theme
-        
         # 新しい設定を適用
         theme = self.theme_combo.currentText()
         language = self.language_combo.currentText()
@@ -1335,62 +2093,67 @@ class FileOrganizerApp(QMainWindow):
         self.config.theme = theme
         self.config.language = language
         self.config.log_level = log_level
+        self.config.organize_config.max_workers = self.workers_spin.value()
         
-        # 設定を保存
-        self.config.save(self.config_path)
+        # 設定を保存（予約中のルール変更もこの書き込みに含まれる）
+        self._save_config()
         
-        # 言語または外観が変更された場合、再起動が必要
-        if old_lang != language or old_theme != theme:
-            QMessageBox.information(
-                self, 
-                self.t["confirm"],
-                "設定を適用するには、アプリケーションを再起動してください。"
-            )
-        else:
-            # ロガーの設定を更新
-            setup_logger(level=log_level)
-            
-            QMessageBox.information(
-                self, 
-                self.t["confirm"],
-                "設定を保存しました。"
-            )
+        # ロガーの設定を更新
+        setup_logger(level=log_level)
+        
+        # 外観と言語は再起動せずにその場で切り替える
+        self.apply_theme(theme)
+        if language != self.lang:
+            self.set_language(language)
+        
+        QMessageBox.information(
+            self, 
+            self.t.confirm,
+            "設定を保存しました。"
+        )
 
     def reset_settings(self):
         """設定をデフォルトに戻す"""
-        reply = QMessageBox.question(
-            self, 
-            self.t["confirm"],
-            "設定をデフォルトに戻しますか？",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
+        if self.confirm("設定をデフォルトに戻しますか？"):
             # バックアップを作成
             try:
                 backup_path = self.config.backup(self.config_path)
                 QMessageBox.information(
                     self, 
-                    self.t["confirm"],
+                    self.t.confirm,
                     f"現在の設定のバックアップを作成しました: {backup_path}"
                 )
             except Exception as e:
                 QMessageBox.warning(
                     self, 
-                    self.t["error"],
+                    self.t.error,
                     f"バックアップの作成に失敗しました: {str(e)}"
                 )
             
             # 新しい設定を作成
             self.config = Config()
-            self.config.save(self.config_path)
+            self._save_config()
+            
+            # 構築済みのルールタブは新しい設定のルール一覧を参照させる
+            if self.create_rules_tab not in self._tab_builders.values():
+                self.update_rules_table()
+            
+            # 外観・言語・ログレベルも再起動せずにその場で戻す
+            self.apply_theme(self.config.theme)
+            setup_logger(level=self.config.log_level)
+            if self.config.language != self.lang:
+                self.set_language(self.config.language)
+            else:
+                # 構築済みの設定タブはデフォルトの値で作り直す
+                for index, builder in self._lazy_tabs.items():
+                    if builder == self.create_settings_tab and index not in self._tab_builders:
+                        self._replace_tab(index, builder())
             
             # UIを更新
             QMessageBox.information(
                 self, 
-                self.t["confirm"],
-                "設定をデフォルトに戻しました。アプリケーションを再起動してください。"
+                self.t.confirm,
+                "設定をデフォルトに戻しました。"
             )
 class FileOrganizerGUI:
     def __init__(self):
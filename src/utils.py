@@ -5,63 +5,91 @@
 import os
 import sys
 import platform
+import time
 import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-import logging
+from typing import Dict, List, Any, Optional, Set, Tuple
 from loguru import logger
 
+# プロセス中に変わらない値はインポート時に一度だけ取得する
+_SYSTEM = platform.system()
+_HOME = os.path.expanduser('~')
+
+# このプロセスで作成を確認済みのログディレクトリ
+_ensured_log_dirs: Set[str] = set()
+
+# setup_loggerで指定できるログレベル
+_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+# 現在のロガーの設定（ログディレクトリ, レベル, ログファイルの日付）。同じ設定での再設定を省くために使う
+_logger_settings: Optional[Tuple[Optional[str], str, Optional[str]]] = None
+
 def setup_logger(log_dir: Optional[str] = None, level: str = "INFO") -> None:
-    """ロガーの設定を行う"""
-    # レベルマッピング
-    level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL
-    }
-    log_level = level_map.get(level.upper(), logging.INFO)
+    """ロガーの設定を行う
+    
+    出力はキュー経由でバックグラウンドのスレッドが書き込むため、ログを出す側は
+    標準エラー出力やファイルへの書き込みを待たない（未出力分は終了時に書き出される）。
+    現在と同じ設定で呼び出した場合は、出力先を開き直さずにそのまま使う。
+    """
+    global _logger_settings
+    
+    # loguruにはレベル名をそのまま渡す（未知のレベルはINFO）
+    log_level = level.upper()
+    if log_level not in _LOG_LEVELS:
+        log_level = "INFO"
+    
+    # ログファイル名の日付は呼び出し時点のもの（日付が変わった後の再設定では新しいファイルに切り替える）
+    today = datetime.date.today().strftime('%Y%m%d')
+    settings = (log_dir, log_level, today if log_dir else None)
+    if settings == _logger_settings:
+        return
     
     # loguru ロガーの設定をクリア
     logger.remove()
     
     # 標準エラー出力へのハンドラを追加
-    logger.add(sys.stderr, level=log_level)
+    logger.add(sys.stderr, level=log_level, enqueue=True)
     
     # ログファイルへの出力を設定
     if log_dir:
         log_path = Path(log_dir)
-        log_path.mkdir(parents=True, exist_ok=True)
-        log_file = log_path / f"file_organizer_{datetime.datetime.now().strftime('%Y%m%d')}.log"
+        if log_dir not in _ensured_log_dirs:
+            log_path.mkdir(parents=True, exist_ok=True)
+            _ensured_log_dirs.add(log_dir)
+        log_file = log_path / f"file_organizer_{today}.log"
         logger.add(
             str(log_file),
             rotation="10 MB",
             retention="30 days",
-            level=log_level
+            level=log_level,
+            enqueue=True,
+            buffering=8192
         )
+    
+    _logger_settings = settings
 
 def get_user_documents_dir() -> str:
     """ユーザーのドキュメントディレクトリを取得"""
-    system = platform.system()
+    system = _SYSTEM
     
     if system == 'Windows':
-        return os.path.join(os.path.expanduser('~'), 'Documents')
+        return os.path.join(_HOME, 'Documents')
     elif system == 'Darwin':  # macOS
-        return os.path.join(os.path.expanduser('~'), 'Documents')
+        return os.path.join(_HOME, 'Documents')
     elif system == 'Linux':
         # Linuxでは一般的に~/Documentsが使われる
-        docs_dir = os.path.join(os.path.expanduser('~'), 'Documents')
+        docs_dir = os.path.join(_HOME, 'Documents')
         if os.path.exists(docs_dir):
             return docs_dir
         else:
-            return os.path.expanduser('~')  # ホームディレクトリをフォールバック
+            return _HOME  # ホームディレクトリをフォールバック
     else:
-        return os.path.expanduser('~')
+        return _HOME
 
 def get_app_data_dir() -> str:
     """アプリケーションデータディレクトリを取得"""
-    system = platform.system()
+    system = _SYSTEM
     app_name = "FileOrganizer"
     
     if system == 'Windows':
@@ -69,16 +97,19 @@ def get_app_data_dir() -> str:
         if app_data:
             return os.path.join(app_data, app_name)
         else:
-            return os.path.join(os.path.expanduser('~'), f'.{app_name.lower()}')
+            return os.path.join(_HOME, f'.{app_name.lower()}')
     elif system == 'Darwin':  # macOS
-        return os.path.join(os.path.expanduser('~'), 'Library', 'Application Support', app_name)
+        return os.path.join(_HOME, 'Library', 'Application Support', app_name)
     else:  # Linux/UNIX
         # XDG Base Directory 仕様に従う
         xdg_config_home = os.getenv('XDG_CONFIG_HOME')
         if xdg_config_home:
             return os.path.join(xdg_config_home, app_name)
         else:
-            return os.path.join(os.path.expanduser('~'), f'.{app_name.lower()}')
+            return os.path.join(_HOME, f'.{app_name.lower()}')
+
+# ファイルサイズの単位（1024倍ごと）
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
 
 def get_file_size_str(size_in_bytes: int) -> str:
     """ファイルサイズを人間が読みやすい形式に変換"""
@@ -86,22 +117,22 @@ def get_file_size_str(size_in_bytes: int) -> str:
     if size_in_bytes < 1024:
         return f"{size_in_bytes} B"
     
-    # キロバイト
-    size_in_kb = size_in_bytes / 1024
-    if size_in_kb < 1024:
-        return f"{size_in_kb:.2f} KB"
-    
-    # メガバイト
-    size_in_mb = size_in_kb / 1024
-    if size_in_mb < 1024:
-        return f"{size_in_mb:.2f} MB"
-    
-    # ギガバイト
-    size_in_gb = size_in_mb / 1024
-    return f"{size_in_gb:.2f} GB"
+    # ビット長から単位を決める（10ビットごとに1024倍、最大はギガバイト）
+    index = min((size_in_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_in_bytes / (1 << (10 * index)):.2f} {_SIZE_UNITS[index]}"
 
 def get_relative_path(path: str, base_path: str) -> str:
     """ベースパスからの相対パスを取得"""
+    # よくある「ベースパス配下のパス」の場合は文字列の切り出しだけで済ませる
+    # （"."や".."、連続した区切り文字を含む場合は正規化が必要なのでrelpathに任せる）
+    base_with_sep = base_path.rstrip(os.sep) + os.sep
+    if base_path and path.startswith(base_with_sep):
+        tail = path[len(base_with_sep):]
+        if (tail and tail[0] not in (os.sep, os.curdir)
+                and os.sep + os.curdir not in tail and os.sep * 2 not in tail
+                and not tail.endswith(os.sep)):
+            return tail
+    
     try:
         return os.path.relpath(path, base_path)
     except ValueError:
@@ -121,7 +152,11 @@ def get_default_log_dir() -> str:
     os.makedirs(log_dir, exist_ok=True)
     return log_dir
 
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    """秒単位のタイムスタンプをフォーマット（同じ秒の結果は再利用する）"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(seconds))
+
 def format_timestamp(timestamp: float) -> str:
     """タイムスタンプを読みやすい形式にフォーマット"""
-    dt = datetime.datetime.fromtimestamp(timestamp)
-    return dt.strftime('%Y-%m-%d %H:%M:%S')
\ No newline at end of file
+    return _format_seconds(int(timestamp // 1))
@@ -0,0 +1,82 @@
+"""
+コマンドラインモジュールのテスト
+"""
+
+import os
+import shutil
+import tempfile
+import pytest
+from loguru import logger
+
+import src.cli
+from src.cli import parse_args, cli_mode
+
+
+class TestCli:
+    """コマンドラインモードのテスト"""
+    
+    @pytest.fixture
+    def setup_test_dir(self, monkeypatch):
+        """テスト用の整理元ディレクトリと設定ファイルのセットアップ"""
+        test_dir = tempfile.mkdtemp()
+        source_dir = os.path.join(test_dir, "source")
+        os.mkdir(source_dir)
+        
+        for filename in ["image1.jpg", "image2.png", "memo.xyz"]:
+            with open(os.path.join(source_dir, filename), 'w') as f:
+                f.write(f"This is a test file for {filename}")
+        
+        # ロガーの再設定（シンクの削除）やホームディレクトリへのログ出力を行わない
+        monkeypatch.setattr(src.cli, "setup_logger", lambda *args, **kwargs: None)
+        monkeypatch.setattr(src.cli, "get_default_log_dir", lambda: test_dir)
+        
+        yield test_dir, source_dir
+        
+        shutil.rmtree(test_dir)
+    
+    @pytest.fixture
+    def records(self):
+        """ログの記録を集める"""
+        records = []
+        handler_id = logger.add(lambda message: records.append(message.record), level="INFO")
+        yield records
+        logger.remove(handler_id)
+    
+    def run(self, test_dir, source_dir, *options):
+        """デフォルト設定でコマンドラインモードを実行"""
+        config_path = os.path.join(test_dir, "config.json")
+        return cli_mode(parse_args(["--config", config_path, "--source", source_dir, *options]))
+    
+    def test_scan_only(self, setup_test_dir, records):
+        """--scanは統計を出力し、ファイルを移動しない"""
+        test_dir, source_dir = setup_test_dir
+        
+        assert self.run(test_dir, source_dir, "--scan") == 0
+        
+        stats = [r for r in records if "extensions" in r["extra"]]
+        assert len(stats) == 1
+        assert stats[0]["extra"]["extensions"] == {".jpg": 1, ".png": 1, ".xyz": 1}
+        assert stats[0]["extra"]["total"] == 3
+        assert sorted(os.listdir(source_dir)) == ["image1.jpg", "image2.png", "memo.xyz"]
+    
+    def test_organize(self, setup_test_dir, records):
+        """--organizeはルールに一致するファイルを移動し、統計は出力しない"""
+        test_dir, source_dir = setup_test_dir
+        
+        assert self.run(test_dir, source_dir, "--organize") == 0
+        
+        assert not any("extensions" in r["extra"] for r in records)
+        assert sorted(os.listdir(source_dir)) == ["memo.xyz", "画像"]
+        assert sorted(os.listdir(os.path.join(source_dir, "画像"))) == ["image1.jpg", "image2.png"]
+    
+    def test_scan_and_organize(self, setup_test_dir, records):
+        """--scan --organizeは同じ走査で統計を出力し、ファイルを移動する"""
+        test_dir, source_dir = setup_test_dir
+        
+        assert self.run(test_dir, source_dir, "--scan", "--organize") == 0
+        
+        stats = [r for r in records if "extensions" in r["extra"]]
+        assert len(stats) == 1
+        assert stats[0]["extra"]["extensions"] == {".jpg": 1, ".png": 1, ".xyz": 1}
+        assert sorted(os.listdir(source_dir)) == ["memo.xyz", "画像"]
+        assert sorted(os.listdir(os.path.join(source_dir, "画像"))) == ["image1.jpg", "image2.png"]
@@ -0,0 +1,158 @@
+"""
+設定モジュールのテスト
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import pytest
+
+from src.config import Config, ConfigError, FileRule
+
+
+class TestConfig:
+    """設定クラスのテスト"""
+    
+    @pytest.fixture
+    def config_dir(self):
+        """テスト用ディレクトリのセットアップ"""
+        test_dir = tempfile.mkdtemp()
+        yield test_dir
+        shutil.rmtree(test_dir)
+    
+    def test_load_creates_default(self, config_dir):
+        """設定ファイルが存在しない場合のデフォルト設定の作成テスト"""
+        config_path = os.path.join(config_dir, "config.json")
+        
+        config = Config.load(config_path)
+        
+        # デフォルトのルールが作成され、ファイルにも保存される
+        assert len(config.file_rules) == 5
+        assert os.path.exists(config_path)
+    
+    def test_save_and_load(self, config_dir):
+        """設定の保存と読み込みのテスト"""
+        config_path = os.path.join(config_dir, "config.json")
+        
+        config = Config()
+        config.theme = "Dark"
+        config.organize_config.source_dir = "/tmp/source"
+        config.organize_config.duplicate_action = "rename"
+        config.organize_config.max_workers = 4
+        config.file_rules = [
+            FileRule(name="画像", extensions=[".jpg"], patterns=["^IMG_"], destination="画像")
+        ]
+        config.save(config_path)
+        
+        loaded = Config.load(config_path)
+        
+        assert loaded.theme == "Dark"
+        assert loaded.organize_config.source_dir == "/tmp/source"
+        assert loaded.organize_config.duplicate_action == "rename"
+        assert loaded.organize_config.max_workers == 4
+        assert loaded.file_rules == config.file_rules
+    
+    def test_load_uses_cache(self, config_dir):
+        """変更のない設定ファイルの再読み込みでキャッシュが使われることのテスト"""
+        config_path = os.path.join(config_dir, "config.json")
+        Config().save(config_path)
+        
+        first = Config.load(config_path)
+        second = Config.load(config_path)
+        assert second == first
+        
+        # 呼び出し側での変更はキャッシュに影響しない
+        second.theme = "Dark"
+        assert Config.load(config_path).theme == first.theme
+        
+        # ファイルが外部で変更された場合は読み込み直す
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump({"theme": "Blue", "language": "en"}, f)
+        
+        reloaded = Config.load(config_path)
+        assert reloaded is not first
+        assert reloaded.theme == "Blue"
+        assert reloaded.language == "en"
+    
+    def test_backup(self, config_dir):
+        """設定ファイルのバックアップのテスト"""
+        config_path = os.path.join(config_dir, "config.json")
+        config = Config(theme="Dark")
+        config.save(config_path)
+        
+        # 連続してバックアップしても別々のファイルが作成される
+        first = config.backup(config_path)
+        second = config.backup(config_path)
+        
+        assert first != second
+        for backup_path in (first, second):
+            assert os.path.basename(backup_path).startswith("config.json.backup.")
+            with open(backup_path, 'r', encoding='utf-8') as f:
+                assert json.load(f)["theme"] == "Dark"
+        
+        # バックアップ対象が存在しない場合
+        with pytest.raises(ConfigError):
+            config.backup(os.path.join(config_dir, "missing.json"))
+    
+    def test_load_invalid_json(self, config_dir):
+        """不正な設定ファイルの読み込みテスト"""
+        config_path = os.path.join(config_dir, "config.json")
+        with open(config_path, 'w', encoding='utf-8') as f:
+            f.write("{invalid json")
+        
+        with pytest.raises(ConfigError):
+            Config.load(config_path)
+    
+    def test_save_keeps_non_ascii(self, config_dir):
+        """日本語がエスケープされずに保存されることのテスト"""
+        config_path = os.path.join(config_dir, "config.json")
+        
+        config = Config(file_rules=[FileRule(name="文書", extensions=[".txt"], destination="文書")])
+        config.save(config_path)
+        
+        with open(config_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        assert "文書" in content
+        assert json.loads(content)["file_rules"][0]["name"] == "文書"
+    
+    def test_save_replaces_file(self, config_dir):
+        """上書き保存で一時ファイルが残らないことのテスト"""
+        config_path = os.path.join(config_dir, "config.json")
+        
+        Config(theme="Light").save(config_path)
+        Config(theme="Dark").save(config_path)
+        
+        assert os.listdir(config_dir) == ["config.json"]
+        with open(config_path, 'r', encoding='utf-8') as f:
+            assert json.load(f)["theme"] == "Dark"
+    
+    @pytest.mark.skipif(os.name == 'nt', reason="POSIXの権限のみを確認")
+    def test_save_keeps_file_mode(self, config_dir):
+        """上書き保存で設定ファイルの権限が保たれることのテスト"""
+        config_path = os.path.join(config_dir, "config.json")
+        
+        # 新規作成時は通常のファイルと同じくumaskに従う
+        umask = os.umask(0)
+        os.umask(umask)
+        Config().save(config_path)
+        assert os.stat(config_path).st_mode & 0o777 == 0o666 & ~umask
+        
+        # 既存ファイルの権限は上書き後も変わらない
+        os.chmod(config_path, 0o640)
+        Config(theme="Dark").save(config_path)
+        assert os.stat(config_path).st_mode & 0o777 == 0o640
+    
+    def test_save_snapshot_text(self, config_dir):
+        """事前に作成したJSON文字列での保存のテスト"""
+        config_path = os.path.join(config_dir, "config.json")
+        
+        config = Config(theme="Dark")
+        text = config.to_json()
+        # 文字列の作成後に変更しても、書き込まれるのは作成時点の内容
+        config.theme = "Light"
+        config.save(config_path, text)
+        
+        with open(config_path, 'r', encoding='utf-8') as f:
+            assert json.load(f)["theme"] == "Dark"
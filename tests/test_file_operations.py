@@ -9,7 +9,7 @@ import pytest
 from pathlib import Path
 
 from src.config import FileRule
-from src.file_operations import FileOperations, FileInfo
+from src.file_operations import FileOperations, FileInfo, CASE_INSENSITIVE_NAMES
 
 class TestFileOperations:
     """ファイル操作クラスのテスト"""
@@ -80,6 +80,72 @@ class TestFileOperations:
         # 直下の7ファイル + サブディレクトリの2ファイル = 計9ファイル
         assert len(files) == 9
     
+    def test_iter_directory(self, setup_test_dir):
+        """ジェネレーターによるスキャンのテスト"""
+        test_dir = setup_test_dir
+        
+        files = FileOperations.iter_directory(test_dir, include_subdirs=True)
+        assert not isinstance(files, list)
+        
+        names = sorted(f.name for f in files)
+        expected = sorted(f.name for f in FileOperations.scan_directory(test_dir, include_subdirs=True))
+        assert names == expected
+    
+    def test_iter_directory_max_depth(self, setup_test_dir):
+        """サブディレクトリの階層制限のテスト"""
+        test_dir = setup_test_dir
+        
+        # 2階層目のファイルを追加
+        nested = os.path.join(test_dir, "subdir", "nested")
+        os.mkdir(nested)
+        with open(os.path.join(nested, "nested.txt"), 'w') as f:
+            f.write("nested")
+        
+        names = {f.name for f in FileOperations.iter_directory(test_dir, True, max_depth=1)}
+        assert "subdir_document.txt" in names
+        assert "nested.txt" not in names
+        
+        names = {f.name for f in FileOperations.iter_directory(test_dir, True)}
+        assert "nested.txt" in names
+    
+    def test_iter_directory_parallel(self, setup_test_dir):
+        """サブディレクトリごとの並列スキャンのテスト"""
+        test_dir = setup_test_dir
+        
+        # 並列スキャンに切り替わる数のサブディレクトリと2階層目のファイルを追加
+        for i in range(6):
+            nested = os.path.join(test_dir, f"parallel{i}", "nested")
+            os.makedirs(nested)
+            with open(os.path.join(test_dir, f"parallel{i}", f"file{i}.txt"), 'w') as f:
+                f.write(str(i))
+            with open(os.path.join(nested, f"nested{i}.txt"), 'w') as f:
+                f.write(str(i))
+        
+        names = sorted(f.name for f in FileOperations.iter_directory_parallel(test_dir, True))
+        expected = sorted(f.name for f in FileOperations.iter_directory(test_dir, True))
+        assert names == expected
+        
+        names = sorted(f.name for f in FileOperations.iter_directory_parallel(test_dir, True, max_depth=1))
+        expected = sorted(f.name for f in FileOperations.iter_directory(test_dir, True, max_depth=1))
+        assert names == expected
+        assert "nested0.txt" not in names
+        
+        # 階層数が0の場合は直下のファイルのみ
+        names = sorted(f.name for f in FileOperations.iter_directory_parallel(test_dir, True, max_depth=0))
+        expected = sorted(f.name for f in FileOperations.iter_directory(test_dir, True, max_depth=0))
+        assert names == expected
+        assert "file0.txt" not in names
+    
+    def test_list_subdirectories(self, setup_test_dir):
+        """直下のサブディレクトリ取得のテスト"""
+        test_dir = setup_test_dir
+        
+        subdirs = FileOperations.list_subdirectories(test_dir)
+        assert subdirs == [os.path.join(test_dir, "subdir")]
+        
+        # 存在しないディレクトリは空のリストになる
+        assert FileOperations.list_subdirectories(os.path.join(test_dir, "missing")) == []
+    
     def test_match_file_with_rules(self, setup_test_dir):
         """ファイルとルールのマッチングテスト"""
         test_dir = setup_test_dir
@@ -133,6 +199,93 @@ class TestFileOperations:
                 matched_rule = FileOperations.match_file_with_rules(file_info, rules)
                 assert matched_rule.name == "レポート"
     
+    def test_match_file_with_invalid_pattern(self, setup_test_dir):
+        """不正な正規表現を含むルールのマッチングテスト"""
+        test_dir = setup_test_dir
+        
+        rules = [
+            FileRule(
+                name="無効",
+                patterns=["report_["],
+                destination="無効",
+                enabled=False
+            ),
+            FileRule(
+                name="レポート",
+                patterns=["report_[", "^test_"],
+                destination="レポート"
+            )
+        ]
+        
+        file_info = FileInfo.from_path(Path(test_dir) / "test_report.pdf")
+        
+        # 不正なパターンは無視され、後続のパターンでマッチする
+        matched_rule = FileOperations.match_file_with_rules(file_info, rules)
+        assert matched_rule.name == "レポート"
+        
+        # どのルールにも一致しない場合はNone
+        file_info = FileInfo.from_path(Path(test_dir) / "image1.jpg")
+        assert FileOperations.match_file_with_rules(file_info, rules) is None
+    
+    def test_match_file_with_multiple_patterns(self, setup_test_dir):
+        """複数パターンを持つルールのマッチングテスト"""
+        test_dir = setup_test_dir
+        
+        rules = [
+            FileRule(name="画像", patterns=["^image", "^report_\\d+|^document1"], destination="画像"),
+            # インラインフラグを含むパターンは個別に照合される
+            FileRule(name="アーカイブ", patterns=["(?i)^ARCHIVE", "^zzz"], destination="アーカイブ"),
+        ]
+        
+        for filename, expected in [
+            ("image2.png", "画像"),
+            ("report_2023.docx", "画像"),
+            ("document1.txt", "画像"),
+            ("archive1.zip", "アーカイブ"),
+        ]:
+            file_info = FileInfo.from_path(Path(test_dir) / filename)
+            assert FileOperations.match_file_with_rules(file_info, rules).name == expected
+        
+        file_info = FileInfo.from_path(Path(test_dir) / "document2.pdf")
+        assert FileOperations.match_file_with_rules(file_info, rules) is None
+    
+    def test_match_file_with_backreference(self, setup_test_dir):
+        """グループ番号の後方参照を含む複数パターンのマッチングテスト"""
+        test_dir = setup_test_dir
+        
+        file_path = Path(test_dir) / "a11.txt"
+        file_path.write_text("backreference")
+        
+        # 2つ目のパターンの\1は、そのパターン自身のグループを参照する
+        rules = [FileRule(name="連番", patterns=["^(x)yz", r"(\d)\1"], destination="連番")]
+        
+        file_info = FileInfo.from_path(file_path)
+        assert FileOperations.match_file_with_rules(file_info, rules).name == "連番"
+        
+        file_info = FileInfo.from_path(Path(test_dir) / "report_2023.docx")
+        assert FileOperations.match_file_with_rules(file_info, rules) is None
+    
+    def test_match_file_rule_priority(self, setup_test_dir):
+        """拡張子ルールとパターンルールの優先順位のテスト"""
+        test_dir = setup_test_dir
+        
+        rules = [
+            FileRule(name="レポート", patterns=["^test_"], destination="レポート"),
+            FileRule(name="PDF文書", extensions=[".PDF"], destination="PDF"),
+            FileRule(name="その他", patterns=["."], destination="その他"),
+        ]
+        
+        # 先に定義されたパターンルールが拡張子ルールより優先される
+        file_info = FileInfo.from_path(Path(test_dir) / "test_report.pdf")
+        assert FileOperations.match_file_with_rules(file_info, rules).name == "レポート"
+        
+        # 拡張子は大文字小文字を区別しない。後ろのパターンルールより拡張子ルールが優先される
+        file_info = FileInfo.from_path(Path(test_dir) / "document2.pdf")
+        assert FileOperations.match_file_with_rules(file_info, rules).name == "PDF文書"
+        
+        file_info = FileInfo.from_path(Path(test_dir) / "image1.jpg")
+        assert FileOperations.match_file_with_rules(file_info, rules).name == "その他"
+    
     def test_organize_files(self, setup_test_dir):
         """ファイル整理機能のテスト"""
         test_dir = setup_test_dir
@@ -194,6 +347,134 @@ class TestFileOperations:
         # 画像ファイルは2つ
         assert len(image_files) == 2
     
+    def test_organize_files_progress(self, setup_test_dir):
+        """ファイル整理の進捗通知のテスト"""
+        test_dir = setup_test_dir
+        
+        rules = [FileRule(name="PDF文書", extensions=[".pdf"], destination="PDF")]
+        files = FileOperations.scan_directory(test_dir, include_subdirs=False)
+        
+        progress = []
+        FileOperations.organize_files(
+            files, rules, test_dir,
+            progress_callback=lambda done, total: progress.append((done, total))
+        )
+        
+        # 移動したファイルごとに(完了数, 総数)が通知される
+        assert progress == [(1, 2), (2, 2)]
+    
+    def test_organize_files_name_collision(self, setup_test_dir):
+        """同じバッチ内で移動先のファイル名が衝突する場合のテスト"""
+        test_dir = setup_test_dir
+        
+        # サブディレクトリに直下と同名で内容の異なるファイルを作成
+        with open(os.path.join(test_dir, "subdir", "document1.txt"), 'w') as f:
+            f.write("Different content in subdirectory")
+        
+        rules = [
+            FileRule(
+                name="テキスト文書",
+                extensions=[".txt"],
+                destination="テキスト"
+            )
+        ]
+        
+        files = FileOperations.scan_directory(test_dir, include_subdirs=True)
+        result = FileOperations.organize_files(
+            files,
+            rules,
+            test_dir,
+            handle_duplicates=True,
+            duplicate_action="skip",
+            max_workers=4
+        )
+        
+        # 3つのテキストファイルがすべて上書きされずに移動される
+        assert len(result["success"]) == 3
+        assert len(result["error"]) == 0
+        
+        text_files = sorted(os.listdir(os.path.join(test_dir, "テキスト")))
+        assert text_files == ["document1.txt", "document1_1.txt", "subdir_document.txt"]
+    
+    def test_organize_files_existing_destination(self, setup_test_dir):
+        """移動先に同名ファイルが既に存在する場合のテスト"""
+        test_dir = setup_test_dir
+        
+        # 移動先に既存のファイルを用意（Windows/macOSでは大文字小文字のみ異なる名前も衝突として扱う）
+        dest_dir = os.path.join(test_dir, "画像")
+        os.mkdir(dest_dir)
+        for name in ["image1.jpg", "image1_1.jpg", "IMAGE2.PNG"]:
+            with open(os.path.join(dest_dir, name), 'w') as f:
+                f.write(f"existing {name}")
+        
+        rules = [
+            FileRule(
+                name="画像",
+                extensions=[".jpg", ".png"],
+                destination="画像"
+            )
+        ]
+        
+        files = FileOperations.scan_directory(test_dir, include_subdirs=False)
+        result = FileOperations.organize_files(files, rules, test_dir, handle_duplicates=False)
+        
+        assert len(result["success"]) == 2
+        image2 = "image2_1.png" if CASE_INSENSITIVE_NAMES else "image2.png"
+        assert sorted(os.listdir(dest_dir)) == sorted([
+            "IMAGE2.PNG", "image1.jpg", "image1_1.jpg", "image1_2.jpg", image2
+        ])
+    
+    def test_iter_organize_files(self, setup_test_dir):
+        """整理結果を1件ずつ返すジェネレーターのテスト"""
+        test_dir = setup_test_dir
+        
+        rules = [
+            FileRule(
+                name="画像",
+                extensions=[".jpg", ".png"],
+                destination="画像"
+            )
+        ]
+        
+        files = FileOperations.scan_directory(test_dir, include_subdirs=False)
+        results = list(FileOperations.iter_organize_files(files, rules, test_dir, handle_duplicates=False))
+        
+        # ルールに一致しないファイルはスキップ、画像は移動される
+        kinds = [kind for kind, _ in results]
+        assert kinds.count("success") == 2
+        assert kinds.count("skipped") == len(files) - 2
+        assert "error" not in kinds
+        assert sorted(os.listdir(os.path.join(test_dir, "画像"))) == ["image1.jpg", "image2.png"]
+    
+    def test_get_file_extensions(self, setup_test_dir):
+        """拡張子の集計テスト"""
+        test_dir = setup_test_dir
+        
+        extensions = FileOperations.get_file_extensions(test_dir, include_subdirs=False)
+        assert extensions == {".txt": 1, ".pdf": 2, ".jpg": 1, ".png": 1, ".zip": 1, ".docx": 1}
+        
+        # サブディレクトリを含む場合
+        extensions = FileOperations.get_file_extensions(test_dir, include_subdirs=True)
+        assert extensions[".txt"] == 2
+        assert extensions[".jpg"] == 2
+    
+    def test_get_file_extensions_unreadable_subdir(self, setup_test_dir, monkeypatch):
+        """読み込めないサブディレクトリがある場合の拡張子の集計テスト"""
+        test_dir = setup_test_dir
+        subdir = os.path.join(test_dir, "subdir")
+        
+        # サブディレクトリの読み込みだけを失敗させる
+        real_scandir = os.scandir
+        def failing_scandir(path):
+            if path == subdir:
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+        monkeypatch.setattr(os, "scandir", failing_scandir)
+        
+        # 読み込めたディレクトリの集計は残る
+        extensions = FileOperations.get_file_extensions(test_dir, include_subdirs=True)
+        assert extensions == {".txt": 1, ".pdf": 2, ".jpg": 1, ".png": 1, ".zip": 1, ".docx": 1}
+    
     def test_find_duplicates(self):
         """重複ファイル検出のテスト"""
         # 一時ディレクトリの作成
@@ -229,11 +510,72 @@ class TestFileOperations:
             assert len(duplicates) == 1
             
             # 各グループに含まれるファイルは2つ
-            for hash_key, file_list in duplicates.items():
+            for (size, file_hash), file_list in duplicates.items():
                 assert len(file_list) == 2
                 assert any(file.path.name == "file1.txt" for file in file_list)
                 assert any(file.path.name == "file2.txt" for file in file_list)
+                # 渡したFileInfoオブジェクトそのものが返され、ハッシュ値もそこに記録される
+                assert all(any(file is given for given in files) for file in file_list)
+                assert all(file.size == size and file.hash == file_hash for file in file_list)
         
         finally:
             # クリーンアップ
-            shutil.rmtree(test_dir)
\ No newline at end of file
+            shutil.rmtree(test_dir)
+    
+    def test_find_duplicates_large_files(self):
+        """先頭部分が同じで内容の異なる大きなファイルの重複検出テスト"""
+        test_dir = tempfile.mkdtemp()
+        
+        try:
+            head = b"x" * 8192
+            contents = {
+                "big1.bin": head + b"same tail",
+                "big2.bin": head + b"same tail",
+                "big3.bin": head + b"diff tail",
+                "unique.bin": b"unique size",
+            }
+            for name, data in contents.items():
+                with open(os.path.join(test_dir, name), 'wb') as f:
+                    f.write(data)
+            
+            files = FileOperations.scan_directory(test_dir)
+            duplicates = FileOperations.find_duplicates(files)
+            
+            assert len(duplicates) == 1
+            names = sorted(f.name for group in duplicates.values() for f in group)
+            assert names == ["big1.bin", "big2.bin"]
+            
+            # ジェネレーターを渡しても同じ結果になる
+            streamed = FileOperations.find_duplicates(FileOperations.iter_directory(test_dir))
+            assert sorted(f.name for group in streamed.values() for f in group) == names
+            
+            # サイズが一意のファイルはハッシュ計算の対象にならない
+            unique = next(f for f in files if f.name == "unique.bin")
+            assert unique.hash is None
+        
+        finally:
+            shutil.rmtree(test_dir)
+    
+    def test_find_duplicates_same_head_different_size(self):
+        """先頭1MBが同じでサイズの異なるファイルを重複扱いしないテスト"""
+        test_dir = tempfile.mkdtemp()
+        
+        try:
+            head = b"x" * (1024 * 1024)
+            contents = {
+                "short1.bin": head + b"a",
+                "short2.bin": head + b"a",
+                "long1.bin": head + b"a" * 100,
+                "long2.bin": head + b"a" * 100,
+            }
+            for name, data in contents.items():
+                with open(os.path.join(test_dir, name), 'wb') as f:
+                    f.write(data)
+            
+            duplicates = FileOperations.find_duplicates(FileOperations.scan_directory(test_dir))
+            
+            groups = sorted(sorted(f.name for f in group) for group in duplicates.values())
+            assert groups == [["long1.bin", "long2.bin"], ["short1.bin", "short2.bin"]]
+        
+        finally:
+            shutil.rmtree(test_dir)